@@ -24,6 +24,14 @@ def test():
     """Run tests."""
     run_uv(["python", "-m", "pytest"])
 
+def precompile():
+    """Precompile server templates into templates.zip."""
+    run_uv([
+        "run", "python", "-c",
+        "from create_mcp_server.core.template import ServerTemplate; "
+        "ServerTemplate.precompile()"
+    ])
+
 def lint():
     """Run linters."""
     run_uv(["python", "-m", "ruff", "check", "."])
@@ -34,6 +42,7 @@ if __name__ == "__main__":
         "setup": setup,
         "test": test,
         "lint": lint,
+        "precompile": precompile,
     }
     
     if len(sys.argv) < 2 or sys.argv[1] not in commands:
@@ -14,26 +14,28 @@ from.utils.process import (
     kill_process,
     run_background_process,
     run_uv_command,
+    run_uv_commands_batched,
 )
 from.utils.validation import (
     check_package_name,
+    check_package_names,
     check_project_path,
     check_version,
-    print_validation_error,
     validate_description,
 )
 
 __all__ = [
     "atomic_write",
     "check_package_name",
+    "check_package_names",
     "check_project_path",
     "check_uv_version",
     "check_version",
     "ensure_uv_installed",
     "kill_process",
-    "print_validation_error",
     "run_background_process",
     "run_uv_command",
+    "run_uv_commands_batched",
     "safe_rmtree",
     "validate_description", 
 ]
\ No newline at end of file
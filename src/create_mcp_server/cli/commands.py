@@ -14,11 +14,11 @@ from typing import Optional
 
 import click
 
-from create_mcp_server.claude import has_claude_app, update_claude_config
 from create_mcp_server.core.project import PyProject
 from create_mcp_server.core.template import ServerTemplate
 from create_mcp_server.server.config import ServerConfig
 from create_mcp_server.server.manager import ServerManager
+from create_mcp_server.utils.claude import has_claude_app, update_claude_config
 from create_mcp_server.utils.validation import check_package_name
 from create_mcp_server.utils.process import ensure_uv_installed, ProcessError
 
@@ -81,9 +81,9 @@ def create(
             raise click.UsageError("Project name is required")
 
         # Validate project name
-        is_valid, error = check_package_name(name)
-        if not is_valid:
-            raise click.UsageError(error)
+        result = check_package_name(name)
+        if not result.is_valid:
+            raise click.UsageError(result.message)
 
         # Get parent directory and create project path
         parent_dir = path or Path.cwd()
@@ -83,9 +83,9 @@ class ProjectCreator:
             ProjectError: If project name is invalid
         """
         # Validate project name immediately
-        is_valid, error = check_package_name(name)
-        if not is_valid:
-            raise ProjectError(f"Invalid project name: {error}")
+        result = check_package_name(name)
+        if not result.is_valid:
+            raise ProjectError(f"Invalid project name: {result.message}")
             
         self.path = path
         self.name = name
@@ -244,7 +244,8 @@ class ProjectCreator:
             ProjectError: If dependency installation fails
         """
         if dependencies is None:
-            dependencies = self.DEFAULT_DEPENDENCIES
+            # One install for everything; copy so the defaults stay intact
+            dependencies = [*self.DEFAULT_DEPENDENCIES]
             if dev:
                 dependencies.extend(self.DEV_DEPENDENCIES)
             
@@ -13,15 +13,20 @@ files. It handles:
 File: create_mcp_server/core/pyproject.py
 """
 
+import copy
+import functools
 import logging
-import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Union
 
 import toml
 from packaging.specifiers import SpecifierSet
-from packaging.version import Version, parse
+
+try:
+    import rtoml
+except ImportError:
+    rtoml = None
 
 from ..utils.files import atomic_write, FileError
 from ..utils.validation import (
@@ -77,11 +82,13 @@ class Dependency:
         """
         try:
             # Extract extras
-            extras_match = re.match(r'([^[]+)(?:\[(.*)\])?', dep_string)
-            if not extras_match:
+            name_ver, bracket, rest = dep_string.partition('[')
+            if not name_ver:
                 raise ValueError(f"Invalid dependency format: {dep_string}")
                 
-            name_ver, extras_str = extras_match.groups()
+            extras_str = None
+            if bracket and ']' in rest:
+                extras_str = rest[:rest.rindex(']')]
             extras = {e.strip() for e in extras_str.split(',')} if extras_str else set()
             
             # Extract version
@@ -148,6 +155,22 @@ class ProjectMetadata:
             
         return errors
 
+def _dumps_toml(data: Dict[str, Any]) -> str:
+    """Serialize TOML, using the native rtoml encoder when installed."""
+    if rtoml is not None:
+        return rtoml.dumps(data, pretty=True)
+    return toml.dumps(data)
+
+@functools.lru_cache(maxsize=32)
+def _load_toml_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a TOML file, memoized on path and modification time.
+    
+    Callers must copy the result before mutating it.
+    """
+    if rtoml is not None:
+        return rtoml.load(Path(path_str))
+    return toml.load(path_str)
+
 class PyProject:
     """Handle pyproject.toml file operations."""
     
@@ -162,9 +185,36 @@ class PyProject:
         """
         self.path = path
         try:
-            self.data = toml.load(path) if path.exists() else {}
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                self._data: Dict[str, Any] = {}
+                self._dirty = True
+            else:
+                self._dirty = False
+                self._data = copy.deepcopy(_load_toml_cached(str(path), mtime_ns))
         except Exception as e:
             raise PyProjectError(f"Failed to load {path}: {e}")
+            
+        # Membership sets mirroring each dependency list, built on first use
+        self._dep_sets: Dict[str, Set[str]] = {}
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Parsed pyproject.toml contents.
+        
+        Callers may edit the returned dict in place, so accessing it marks
+        the project as changed and drops the cached dependency sets.
+        """
+        self._dirty = True
+        self._dep_sets.clear()
+        return self._data
+
+    @data.setter
+    def data(self, value: Dict[str, Any]) -> None:
+        self._dirty = True
+        self._dep_sets.clear()
+        self._data = value
 
     @property
     def metadata(self) -> ProjectMetadata:
@@ -177,7 +227,7 @@ class PyProject:
             InvalidProjectError: If required metadata is missing
         """
         try:
-            project = self.data.get("project", {})
+            project = self._data.get("project", {})
             
             # Parse dependencies
             deps = [
@@ -212,7 +262,9 @@ class PyProject:
     @property
     def scripts(self) -> Dict[str, str]:
         """Get project script entry points."""
-        return self.data.get("project", {}).get("scripts", {})
+        # The mapping is live, so a caller may edit it before saving
+        self._dirty = True
+        return self._data.get("project", {}).get("scripts", {})
 
     def update_metadata(
         self,
@@ -230,8 +282,8 @@ class PyProject:
         Raises:
             InvalidProjectError: If updates would make project invalid
         """
-        if "project" not in self.data:
-            self.data["project"] = {}
+        if "project" not in self._data:
+            self._data["project"] = {}
             
         updates = {}
         if version is not None:
@@ -251,7 +303,8 @@ class PyProject:
             except Exception as e:
                 raise InvalidProjectError(f"Invalid Python version requirement: {e}")
                 
-        self.data["project"].update(updates)
+        self._data["project"].update(updates)
+        self._dirty = True
 
     def add_dependency(
         self,
@@ -279,16 +332,23 @@ class PyProject:
                 extras=extras or set()
             )
             
-            if "project" not in self.data:
-                self.data["project"] = {}
+            if "project" not in self._data:
+                self._data["project"] = {}
                 
             dep_type = "dev-dependencies" if dev else "dependencies"
-            if dep_type not in self.data["project"]:
-                self.data["project"][dep_type] = []
+            if dep_type not in self._data["project"]:
+                self._data["project"][dep_type] = []
+                
+            dep_list = self._data["project"][dep_type]
+            dep_set = self._dep_sets.get(dep_type)
+            if dep_set is None:
+                dep_set = self._dep_sets[dep_type] = set(dep_list)
                 
             dep_str = str(dep)
-            if dep_str not in self.data["project"][dep_type]:
-                self.data["project"][dep_type].append(dep_str)
+            if dep_str not in dep_set:
+                dep_set.add(dep_str)
+                dep_list.append(dep_str)
+                self._dirty = True
                 
         except Exception as e:
             raise DependencyError(f"Failed to add dependency: {e}")
@@ -303,15 +363,16 @@ class PyProject:
         Raises:
             PyProjectError: If script cannot be added
         """
-        if "project" not in self.data:
-            self.data["project"] = {}
-        if "scripts" not in self.data["project"]:
-            self.data["project"]["scripts"] = {}
+        if "project" not in self._data:
+            self._data["project"] = {}
+        if "scripts" not in self._data["project"]:
+            self._data["project"]["scripts"] = {}
             
         if not name.isidentifier():
             raise PyProjectError(f"Invalid script name: {name}")
             
-        self.data["project"]["scripts"][name] = cmd
+        self._data["project"]["scripts"][name] = cmd
+        self._dirty = True
 
     def set_build_system(
         self,
@@ -324,28 +385,38 @@ class PyProject:
             requires: List of build dependencies
             build_backend: Build backend to use
         """
-        if "build-system" not in self.data:
-            self.data["build-system"] = {}
+        if "build-system" not in self._data:
+            self._data["build-system"] = {}
             
         if requires is not None:
-            self.data["build-system"]["requires"] = requires
+            self._data["build-system"]["requires"] = requires
         if build_backend is not None:
-            self.data["build-system"]["build-backend"] = build_backend
+            self._data["build-system"]["build-backend"] = build_backend
+        self._dirty = True
 
     def save(self) -> None:
         """Save changes back to pyproject.toml.
         
+        Does nothing if the data has not changed since it was loaded or
+        last saved. Reading the data attribute counts as a change, since
+        the caller may have edited it.
+        
         Raises:
             PyProjectError: If file cannot be saved
         """
+        if not self._dirty:
+            return
+            
         try:
             # Format with consistent indentation
-            toml_str = toml.dumps(self.data)
+            toml_str = _dumps_toml(self._data)
             
             # Write atomically
             atomic_write(self.path, toml_str)
+            _load_toml_cached.cache_clear()
+            self._dirty = False
             
-        except (FileError, toml.TomlDecodeError) as e:
+        except (FileError, ValueError) as e:
             raise PyProjectError(f"Failed to save {self.path}: {e}")
     
     @classmethod
@@ -390,7 +461,7 @@ class PyProject:
             raise PyProjectError(f"Invalid Python version requirement: {e}")
         
         project = cls(path)
-        project.data = {
+        project._data = {
             "project": {
                 "name": name,
                 "version": version,
@@ -413,6 +484,8 @@ class PyProject:
                 "build-backend": "hatchling.build"
             }
         }
+        project._dep_sets.clear()
+        project._dirty = True
         project.save()
         return project
 
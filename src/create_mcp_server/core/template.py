@@ -7,29 +7,62 @@ naming conventions and output locations.
 File: create-mcp-server/core/template.py
 """
 
+import hashlib
 import logging
+import mmap
+import os
+import re
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Set, Tuple
 
 from jinja2 import (
+    BaseLoader,
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
+    ModuleLoader,
+    Template,
     TemplateError as Jinja2Error,
     TemplateNotFound,
     select_autoescape
 )
 
 from ..server.config import ServerConfig
-from ..utils.files import (
-    atomic_write,
-    ensure_directory,
-    safe_rmtree,
-    atomic_replace
-)
-from ..utils.validation import validate_description
+from ..utils.files import atomic_write_batch, ensure_directory
 
 logger = logging.getLogger(__name__)
 
+# Default template sources and their optional ahead-of-time compiled bundle
+DEFAULT_TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
+COMPILED_TEMPLATES_PATH = Path(__file__).parent.parent / "templates.zip"
+
+# Bundle member holding the digest of the sources the bundle was built from
+BUNDLE_DIGEST_NAME = "sources.sha256"
+
+# Upper bound on threads used to render and write templates
+MAX_RENDER_WORKERS = 8
+
+# Matches a bare variable substitution such as ``{{ server_name }}``
+SIMPLE_VARIABLE_REGEX = re.compile(r'\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}')
+
+def _file_contains(path: str, needle: bytes) -> bool:
+    """Check whether a file contains a byte string without decoding it.
+    
+    Args:
+        path: File to scan
+        needle: Bytes to search for
+        
+    Returns:
+        True if the file contains needle
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < mmap.PAGESIZE:
+            return needle in f.read()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(needle) != -1
+
 class TemplateError(Exception):
     """Base exception for template-related errors."""
     pass
@@ -45,27 +78,27 @@ class RenderError(TemplateError):
 class ServerTemplate:
     """Handles MCP server template generation."""
     
-    # Template file mapping: (template_name, output_path)
-    TEMPLATE_FILES = {
+    # Template file mapping: (template_name, output_path, at_project_root)
+    TEMPLATE_FILES: ClassVar[Tuple[Tuple[str, str, bool], ...]] = (
         # Server core
-        "server/main.py.jinja2": "server.py",
-        "server/__init__.py.jinja2": "__init__.py",
-        "server/config.py.jinja2": "config.py",
-        "server/core.py.jinja2": "core.py",
+        ("server/main.py.jinja2", "server.py", False),
+        ("server/__init__.py.jinja2", "__init__.py", False),
+        ("server/config.py.jinja2", "config.py", False),
+        ("server/core.py.jinja2", "core.py", False),
         
         # Plugins
-        "plugins/__init__.py.jinja2": "plugins/__init__.py",
-        "plugins/example.py.jinja2": "plugins/example.py",
+        ("plugins/__init__.py.jinja2", "plugins/__init__.py", False),
+        ("plugins/example.py.jinja2", "plugins/example.py", False),
         
         # Tests
-        "tests/__init__.py.jinja2": "tests/__init__.py",
-        "tests/test_server.py.jinja2": "tests/test_server.py",
-        
-        # Documentation
-        "README.md.jinja2": "../README.md",  # Relative to package dir
-        "docs/api.md.jinja2": "../docs/api.md",
-        "docs/usage.md.jinja2": "../docs/usage.md",
-    }
+        ("tests/__init__.py.jinja2", "tests/__init__.py", False),
+        ("tests/test_server.py.jinja2", "tests/test_server.py", False),
+        
+        # Documentation (relative to project root)
+        ("README.md.jinja2", "README.md", True),
+        ("docs/api.md.jinja2", "docs/api.md", True),
+        ("docs/usage.md.jinja2", "docs/usage.md", True),
+    )
     
     # Required files that must exist after generation
     REQUIRED_FILES = [
@@ -75,6 +108,12 @@ class ServerTemplate:
         "README.md"
     ]
     
+    # Environments shared by all instances, keyed by resolved template dir
+    _ENV_CACHE: ClassVar[Dict[Path, Environment]] = {}
+    
+    # Template directories whose templates have already been validated
+    _VALIDATED: ClassVar[Set[Path]] = set()
+    
     def __init__(self, template_dir: Optional[Path] = None):
         """Initialize template engine.
         
@@ -83,27 +122,170 @@ class ServerTemplate:
             
         Raises:
             TemplateError: If template directory is invalid
+            
+        When using the default templates and a precompiled bundle built by
+        precompile() is present, templates are loaded from the bundle.
+        The Jinja environment is shared by instances using the same
+        template directory.
         """
         if template_dir is None:
-            template_dir = Path(__file__).parent.parent / "templates"
+            template_dir = DEFAULT_TEMPLATE_DIR
             
         if not template_dir.exists():
             raise TemplateError(f"Template directory not found: {template_dir}")
             
+        template_dir = template_dir.resolve()
         self.template_dir = template_dir
-        self.env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
+        
+        env = self._ENV_CACHE.get(template_dir)
+        if env is None:
+            env = self._ENV_CACHE[template_dir] = self._build_env(
+                self._make_loader(template_dir)
+            )
+        self.env = env
+        
+        # Track generated files for cleanup
+        self._generated_files: Set[Path] = set()
+        
+        # Directories known to exist during the current generation
+        self._known_dirs: Set[Path] = set()
+        
+        # Validate templates once per template directory
+        if template_dir not in self._VALIDATED:
+            self._validate_templates()
+            self._VALIDATED.add(template_dir)
+        
+        # Templates that are static or only substitute variables skip Jinja;
+        # the rest are compiled once, on first render
+        self._static_templates: Dict[str, bytes] = {}
+        self._simple_templates: Dict[str, List[str]] = {}
+        self._compiled: Dict[str, Template] = {}
+        self._prepare_templates()
+
+    @classmethod
+    def _make_loader(cls, template_dir: Path) -> BaseLoader:
+        """Choose the template loader for a template directory.
+        
+        Args:
+            template_dir: Resolved template directory
+            
+        Returns:
+            ModuleLoader for the precompiled default bundle if it was built
+            from the current template sources, otherwise a FileSystemLoader
+        """
+        if (
+            template_dir == DEFAULT_TEMPLATE_DIR.resolve() and
+            COMPILED_TEMPLATES_PATH.exists()
+        ):
+            if cls._bundle_is_current(template_dir):
+                return ModuleLoader(str(COMPILED_TEMPLATES_PATH))
+            logger.warning(
+                "Ignoring outdated template bundle %s; rebuild it with "
+                "ServerTemplate.precompile()",
+                COMPILED_TEMPLATES_PATH
+            )
+        return FileSystemLoader(str(template_dir))
+
+    @classmethod
+    def _source_digest(cls, template_dir: Path) -> Optional[str]:
+        """Hash the template sources a bundle is compiled from.
+        
+        Args:
+            template_dir: Template source directory
+            
+        Returns:
+            Hex SHA-256 over the name and content of each template, or
+            None if none of the sources are present
+        """
+        digest = hashlib.sha256()
+        found = False
+        for template_name, _, _ in cls.TEMPLATE_FILES:
+            digest.update(template_name.encode("utf-8") + b"\0")
+            try:
+                with open(template_dir / template_name, "rb") as f:
+                    content = f.read()
+            except FileNotFoundError:
+                digest.update(b"\0")
+                continue
+            found = True
+            digest.update(b"%d\0" % len(content) + content)
+        return digest.hexdigest() if found else None
+
+    @classmethod
+    def _bundle_is_current(cls, template_dir: Path) -> bool:
+        """Check that the compiled bundle matches its sources.
+        
+        File times are no use here: installers give every extracted file
+        the time it was written, and the bundle is usually written first.
+        
+        Args:
+            template_dir: Template source directory
+            
+        Returns:
+            True if the bundle was built from the sources now present, or
+            if there are no sources to compare with
+        """
+        try:
+            with zipfile.ZipFile(COMPILED_TEMPLATES_PATH) as bundle:
+                stamp = bundle.read(BUNDLE_DIGEST_NAME).decode("ascii")
+        except (OSError, KeyError, UnicodeDecodeError, zipfile.BadZipFile):
+            return False
+        digest = cls._source_digest(template_dir)
+        return digest is None or stamp == digest
+
+    @staticmethod
+    def _build_env(loader: BaseLoader) -> Environment:
+        """Build a Jinja environment with the server template settings.
+        
+        Args:
+            loader: Template loader to use
+            
+        Returns:
+            Configured Environment
+        """
+        return Environment(
+            loader=loader,
+            bytecode_cache=FileSystemBytecodeCache(
+                pattern="create_mcp_server_%s.cache"
+            ),
             autoescape=select_autoescape(['html', 'xml']),
             trim_blocks=True,
             lstrip_blocks=True,
             keep_trailing_newline=True
         )
+
+    @classmethod
+    def precompile(
+        cls,
+        target: Path = COMPILED_TEMPLATES_PATH,
+        template_dir: Optional[Path] = None
+    ) -> None:
+        """Compile templates ahead of time into a zip bundle.
         
-        # Track generated files for cleanup
-        self._generated_files: Set[Path] = set()
-        
-        # Validate templates on initialization
-        self._validate_templates()
+        Args:
+            target: Path of the zip file to write
+            template_dir: Template source directory. If None, uses default.
+            
+        Raises:
+            TemplateError: If any template fails to compile
+        """
+        template_dir = template_dir or DEFAULT_TEMPLATE_DIR
+        env = cls._build_env(FileSystemLoader(str(template_dir)))
+        names = {template_name for template_name, _, _ in cls.TEMPLATE_FILES}
+        try:
+            env.compile_templates(
+                target=str(target),
+                filter_func=names.__contains__,
+                zip="deflated",
+                ignore_errors=False
+            )
+            # Record what the bundle was built from, so an outdated bundle
+            # can be told apart regardless of file times
+            digest = cls._source_digest(template_dir)
+            with zipfile.ZipFile(target, "a") as bundle:
+                bundle.writestr(BUNDLE_DIGEST_NAME, digest or "")
+        except Exception as e:
+            raise TemplateError(f"Failed to precompile templates: {e}")
 
     def create_server(
         self,
@@ -125,9 +307,21 @@ class ServerTemplate:
         try:
             # Clear generated files tracking
             self._generated_files.clear()
+            self._known_dirs.clear()
             
-            # Create directories
-            self._create_directories(package_dir)
+            # Resolve output paths, then create every directory up front
+            bases = (str(package_dir), str(package_dir.parent))
+            jobs = [
+                (
+                    template_name,
+                    self._get_output_path(bases, rel_output_path, at_root)
+                )
+                for template_name, rel_output_path, at_root in self.TEMPLATE_FILES
+            ]
+            self._create_directories(
+                package_dir,
+                {output_path.parent for _, output_path in jobs}
+            )
             
             # Validate configuration
             self._validate_config(config)
@@ -135,18 +329,25 @@ class ServerTemplate:
             # Prepare template context
             context = self._create_context(config, package_dir)
             
-            # Render all templates
-            for template_name, rel_output_path in self.TEMPLATE_FILES.items():
-                output_path = self._get_output_path(
-                    package_dir,
-                    rel_output_path
-                )
-                self._render_template(template_name, output_path, context)
+            # Render all templates, then write them out as one batch
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_RENDER_WORKERS, len(jobs))
+            ) as executor:
+                futures = [
+                    executor.submit(self._render_template, template_name, context)
+                    for template_name, _ in jobs
+                ]
+                outputs = [
+                    (output_path, future.result())
+                    for (_, output_path), future in zip(jobs, futures)
+                ]
+            atomic_write_batch(outputs, written=self._generated_files)
+            logger.debug("Wrote %d rendered templates", len(outputs))
                 
             # Validate output
             self._validate_output(package_dir)
             
-            logger.info(f"Created MCP server in {project_dir}")
+            logger.info("Created MCP server in %s", project_dir)
             
         except Exception as e:
             self._cleanup()
@@ -155,17 +356,66 @@ class ServerTemplate:
             raise TemplateError(f"Failed to create server: {e}")
 
     def _validate_templates(self) -> None:
-        """Validate all template files exist and are readable.
+        """Validate all template files exist.
+        
+        Checks names against the loader's listing without compiling;
+        templates are compiled on first render.
         
         Raises:
             ValidationError: If template validation fails
         """
+        try:
+            available = set(self.env.list_templates())
+        except TypeError:
+            # Loaders such as ModuleLoader cannot enumerate their templates
+            return
+            
+        errors = [
+            f"Template not found: {template_name}"
+            for template_name, _, _ in self.TEMPLATE_FILES
+            if template_name not in available
+        ]
+        if errors:
+            raise ValidationError(
+                "Template validation failed:\n" + "\n".join(errors)
+            )
+
+    def _prepare_templates(self) -> None:
+        """Resolve each template to the cheapest way of rendering it.
+        
+        Templates with no tags at all are kept as bytes and written as they
+        are. Templates whose only tags are bare variable substitutions are
+        pre-split into alternating literal/variable parts. Templates using
+        filters, blocks, or comments are left to Jinja and compiled on
+        first use.
+        Loaders without source access, such as the ModuleLoader for the
+        compiled bundle, are inspected through the source directory.
+        
+        Raises:
+            ValidationError: If a template cannot be loaded
+        """
+        loader = self.env.loader
+        if not loader.has_source_access:
+            loader = FileSystemLoader(str(self.template_dir))
+            
         errors = []
-        for template_name in self.TEMPLATE_FILES:
+        for template_name, _, _ in self.TEMPLATE_FILES:
             try:
-                self.env.get_template(template_name)
+                source, _, _ = loader.get_source(
+                    self.env, template_name
+                )
+                stripped = SIMPLE_VARIABLE_REGEX.sub("", source)
+                if "{{" in stripped or "{%" in stripped or "{#" in stripped:
+                    continue
+                parts = SIMPLE_VARIABLE_REGEX.split(source)
+                if len(parts) == 1:
+                    self._static_templates[template_name] = source.encode("utf-8")
+                else:
+                    self._simple_templates[template_name] = parts
             except TemplateNotFound:
-                errors.append(f"Template not found: {template_name}")
+                # Without its source the bundled template is rendered by Jinja
+                if loader is self.env.loader:
+                    errors.append(f"Template not found: {template_name}")
             except Exception as e:
                 errors.append(f"Invalid template {template_name}: {e}")
                 
@@ -174,6 +424,39 @@ class ServerTemplate:
                 "Template validation failed:\n" + "\n".join(errors)
             )
 
+    def _get_compiled(self, template_name: str) -> Template:
+        """Get a compiled Jinja template, compiling it on first use.
+        
+        Args:
+            template_name: Template file name
+            
+        Returns:
+            Compiled Template
+        """
+        template = self._compiled.get(template_name)
+        if template is None:
+            template = self._compiled[template_name] = self.env.get_template(
+                template_name
+            )
+        return template
+
+    @staticmethod
+    def _render_simple(parts: List[str], context: Dict[str, Any]) -> str:
+        """Render a pre-split template by direct substitution.
+        
+        Args:
+            parts: Alternating literal text and variable names
+            context: Template rendering context
+            
+        Returns:
+            Rendered content, matching Jinja output for undefined variables
+        """
+        rendered = parts[:]
+        for i in range(1, len(rendered), 2):
+            name = rendered[i]
+            rendered[i] = str(context[name]) if name in context else ""
+        return "".join(rendered)
+
     def _validate_config(self, config: ServerConfig) -> None:
         """Validate server configuration.
         
@@ -183,41 +466,54 @@ class ServerTemplate:
         Raises:
             ValidationError: If configuration is invalid
         """
+        # ServerConfig.validate already covers the description
         if errors := config.validate():
             raise ValidationError(
                 "Invalid server configuration:\n" + "\n".join(errors)
             )
-            
-        # Additional template-specific validation
-        if config.description:
-            is_valid, error = validate_description(config.description)
-            if not is_valid:
-                raise ValidationError(f"Invalid description: {error}")
 
-    def _create_directories(self, package_dir: Path) -> None:
+    def _create_directories(
+        self,
+        package_dir: Path,
+        output_dirs: Optional[Set[Path]] = None
+    ) -> None:
         """Create required directories.
         
         Args:
             package_dir: Base package directory
+            output_dirs: Parent directories of the files to be rendered
             
         Raises:
             TemplateError: If directory creation fails
         """
         try:
-            # Create package directory structure
-            directories = [
+            # Create package directory structure, parents first
+            directories = sorted({
                 package_dir,
                 package_dir / "tests",
                 package_dir / "plugins",
                 package_dir.parent / "docs",
-            ]
+                *(output_dirs or ()),
+            })
             
             for directory in directories:
-                ensure_directory(directory)
+                self._ensure_dir(directory)
                 
         except Exception as e:
             raise TemplateError(f"Failed to create directories: {e}")
 
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create a directory unless it is already known to exist.
+        
+        Args:
+            directory: Directory to create
+        """
+        if directory in self._known_dirs:
+            return
+        ensure_directory(directory)
+        self._known_dirs.add(directory)
+        self._known_dirs.update(directory.parents)
+
     def _create_context(
         self,
         config: ServerConfig,
@@ -231,6 +527,8 @@ class ServerTemplate:
             
         Returns:
             Template context dictionary
+            
+        Built once per create_server call and shared by every render.
         """
         return {
             "project_name": config.name,
@@ -242,48 +540,53 @@ class ServerTemplate:
             "log_level": config.log_level.value,
         }
 
-    def _get_output_path(self, package_dir: Path, rel_path: str) -> Path:
+    def _get_output_path(
+        self,
+        bases: Tuple[str, str],
+        rel_path: str,
+        at_project_root: bool = False
+    ) -> Path:
         """Get absolute output path for a template file.
         
         Args:
-            package_dir: Package directory
+            bases: Package directory and project root as strings
             rel_path: Relative output path
+            at_project_root: Whether rel_path is relative to the project root
             
         Returns:
             Absolute Path for output file
         """
-        if rel_path.startswith("../"):
-            # Handle paths relative to project root
-            return package_dir.parent / rel_path[3:]
-        return package_dir / rel_path
+        package_base, project_base = bases
+        return Path(project_base if at_project_root else package_base, rel_path)
 
     def _render_template(
         self,
         template_name: str,
-        output_path: Path,
         context: Dict[str, Any]
-    ) -> None:
+    ) -> bytes:
         """Render a single template.
         
         Args:
             template_name: Template file name
-            output_path: Output file path
             context: Template rendering context
             
+        Returns:
+            Rendered content, encoded as UTF-8
+            
         Raises:
             RenderError: If rendering fails
         """
         try:
-            template = self.env.get_template(template_name)
-            content = template.render(**context)
-            
-            # Ensure parent directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write atomically
-            atomic_write(output_path, content)
-            self._generated_files.add(output_path)
-            logger.debug(f"Created {output_path}")
+            static = self._static_templates.get(template_name)
+            if static is not None:
+                return static
+                
+            parts = self._simple_templates.get(template_name)
+            if parts is not None:
+                rendered = self._render_simple(parts, context)
+            else:
+                rendered = self._get_compiled(template_name).render(context)
+            return rendered.encode("utf-8")
             
         except Jinja2Error as e:
             raise RenderError(f"Template render error in {template_name}: {e}")
@@ -301,21 +604,31 @@ class ServerTemplate:
         """
         errors = []
         
+        # List the directory once instead of stat-ing each required file
+        try:
+            with os.scandir(package_dir) as entries:
+                existing = {entry.name for entry in entries}
+        except OSError:
+            existing = set()
+        
         # Check required files exist
         for filename in self.REQUIRED_FILES:
-            file_path = package_dir / filename
-            if not file_path.exists():
+            if filename not in existing:
                 errors.append(f"Missing required file: {filename}")
                 continue
                 
             # Basic content validation
+            if filename != "server.py":
+                continue
             try:
-                content = file_path.read_text()
-                if filename == "server.py" and "class MCPServer" not in content:
+                if not _file_contains(
+                    os.path.join(package_dir, filename),
+                    b"class MCPServer"
+                ):
                     errors.append(
                         "server.py is missing required MCPServer class"
                     )
-            except Exception as e:
+            except (OSError, ValueError) as e:
                 errors.append(f"Failed to validate {filename}: {e}")
                     
         if errors:
@@ -324,16 +637,20 @@ class ServerTemplate:
             )
 
     def _cleanup(self) -> None:
-        """Clean up generated files on failure."""
+        """Clean up generated files on failure.
+        
+        Only files are tracked, so no ordering is needed to remove them.
+        """
+        self._known_dirs.clear()
+        if not self._generated_files:
+            return
+            
         logger.info("Cleaning up generated files")
         
-        for path in sorted(self._generated_files, reverse=True):
+        for path in self._generated_files:
             try:
-                if path.is_file():
-                    path.unlink(missing_ok=True)
-                elif path.is_dir():
-                    safe_rmtree(path)
+                path.unlink(missing_ok=True)
             except OSError as e:
-                logger.warning(f"Failed to clean up {path}: {e}")
+                logger.warning("Failed to clean up %s: %s", path, e)
                 
         self._generated_files.clear()
\ No newline at end of file
@@ -11,19 +11,89 @@ Uses TypedDict for strict typing of configuration values.
 File: create_mcp_server/server/config.py
 """
 
+import copy
+import functools
 import json
 import logging
+import logging.config
 import os
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypedDict, Union, cast
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Set, Tuple, TypedDict, Union, cast
 
 from create_mcp_server.utils.files import atomic_write
 from create_mcp_server.utils.validation import validate_description, check_package_name
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+def _json_default(value: Any) -> str:
+    """Encode Paths, such as those nested in plugin_config, as strings.
+    
+    Raises:
+        TypeError: For any other value JSON cannot represent
+    """
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(
+        f"Object of type {type(value).__name__} is not JSON serializable"
+    )
+
+def _dumps_json(data: Dict[str, Any]) -> bytes:
+    """Serialize JSON as indented UTF-8, using orjson when installed."""
+    if orjson is not None:
+        # Send datetimes and dataclasses to the default hook, which
+        # rejects them as json.dumps does, rather than encoding them
+        return orjson.dumps(
+            data,
+            default=_json_default,
+            option=(
+                orjson.OPT_INDENT_2 |
+                orjson.OPT_PASSTHROUGH_DATETIME |
+                orjson.OPT_PASSTHROUGH_DATACLASS
+            )
+        )
+    return json.dumps(data, indent=2, default=_json_default).encode('utf-8')
+
+def _loads_json(data: bytes) -> Any:
+    """Parse JSON from raw bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@functools.lru_cache(maxsize=32)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file, memoized on path, modification time and size.
+    
+    Callers must copy the result before mutating it.
+    """
+    with open(path_str, 'rb') as f:
+        return _loads_json(f.read())
+
+def _list_dir(directory: Path) -> Optional[Set[str]]:
+    """List entry names in a directory with a single scandir call.
+    
+    Symlinks are left out, since they may dangle; callers stat them as
+    they would any name missing from the listing.
+    
+    Args:
+        directory: Directory to list
+        
+    Returns:
+        Set of names of entries that are not symlinks, or None if the
+        directory cannot be listed
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if not entry.is_symlink()}
+    except OSError:
+        return None
+
 class ConfigError(Exception):
     """Base exception for configuration errors."""
     pass
@@ -53,7 +123,7 @@ class LogLevel(str, Enum):
         try:
             return cls(level.lower())
         except ValueError:
-            logger.warning(f"Invalid log level '{level}', defaulting to INFO")
+            logger.warning("Invalid log level '%s', defaulting to INFO", level)
             return cls.INFO
 
     def to_python_level(self) -> int:
@@ -62,7 +132,12 @@ class LogLevel(str, Enum):
         Returns:
             Python logging module level constant
         """
-        return getattr(logging, self.value.upper())
+        return _PYTHON_LEVELS[self]
+
+# Python logging level for each LogLevel, computed once at import
+_PYTHON_LEVELS = {
+    level: getattr(logging, level.value.upper()) for level in LogLevel
+}
 
 class ConfigDict(TypedDict, total=False):
     """Type definitions for configuration dictionary.
@@ -83,6 +158,8 @@ class ConfigDict(TypedDict, total=False):
     api_keys: Dict[str, str]
     resource_paths: List[str]
     max_resource_size: int
+    health_check_interval: int
+    status_check_interval: int
     dev_mode: bool
     reload: bool
 
@@ -101,7 +178,58 @@ ENV_MAPPINGS = {
     "MCP_RELOAD": "reload",
 }
 
-@dataclass
+def _split_list(value: str) -> List[str]:
+    """Parse a comma-separated environment value."""
+    return value.split(",")
+
+def _parse_bool(value: str) -> bool:
+    """Parse a true/false environment value."""
+    return value.lower() == "true"
+
+# Type conversions for environment values; unlisted keys stay strings
+ENV_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "port": int,
+    "max_resource_size": int,
+    "enabled_plugins": _split_list,
+    "allowed_origins": _split_list,
+    "dev_mode": _parse_bool,
+    "reload": _parse_bool,
+    "plugin_dir": Path,
+    "log_level": LogLevel.from_string,
+}
+
+# Formatter section shared by every logging configuration
+LOG_FORMATTERS = {
+    'default': {
+        'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    }
+}
+
+# Origins accepted when none are configured
+DEFAULT_ALLOWED_ORIGINS = ("*",)
+
+def _env_field(env_var: str, fallback: Any) -> Any:
+    """Declare a field whose default is read from an environment variable.
+    
+    Args:
+        env_var: Variable in ENV_MAPPINGS to read
+        fallback: Value used when the variable is unset
+        
+    Returns:
+        Dataclass field; the fallback is kept in its metadata for
+        ENV_DEFAULTS
+    """
+    converter = ENV_CONVERTERS.get(ENV_MAPPINGS[env_var])
+    
+    def default() -> Any:
+        value = os.environ.get(env_var)
+        if value is None:
+            return fallback
+        return converter(value) if converter else value
+        
+    return field(default_factory=default, metadata={"env_default": fallback})
+
+@dataclass(slots=True)
 class ServerConfig:
     """Server configuration settings."""
     
@@ -111,20 +239,12 @@ class ServerConfig:
     description: str = "MCP Server"
     
     # Network settings
-    host: str = field(default_factory=lambda: os.getenv("MCP_HOST", "127.0.0.1"))
-    port: int = field(
-        default_factory=lambda: int(os.getenv("MCP_SERVER_PORT", "8000"))
-    )
+    host: str = _env_field("MCP_HOST", "127.0.0.1")
+    port: int = _env_field("MCP_SERVER_PORT", 8000)
     
     # Logging settings
-    log_level: LogLevel = field(
-        default_factory=lambda: LogLevel.from_string(
-            os.getenv("MCP_LOG_LEVEL", "info")
-        )
-    )
-    log_file: Optional[str] = field(
-        default_factory=lambda: os.getenv("MCP_LOG_FILE")
-    )
+    log_level: LogLevel = _env_field("MCP_LOG_LEVEL", LogLevel.INFO)
+    log_file: Optional[str] = _env_field("MCP_LOG_FILE", None)
     
     # Plugin settings
     plugin_dir: Optional[Path] = None
@@ -132,19 +252,29 @@ class ServerConfig:
     plugin_config: Dict[str, Any] = field(default_factory=dict)
     
     # Security settings
-    allowed_origins: List[str] = field(default_factory=lambda: ["*"])
+    allowed_origins: List[str] = field(
+        default_factory=lambda: list(DEFAULT_ALLOWED_ORIGINS)
+    )
     api_keys: Dict[str, str] = field(default_factory=dict)
     
     # Resource settings
     resource_paths: List[Path] = field(default_factory=list)
     max_resource_size: int = 10 * 1024 * 1024  # 10MB
     
+    # Monitoring settings (seconds; 0 disables the loop)
+    health_check_interval: int = 30
+    status_check_interval: int = 60
+    
     # Development settings
-    dev_mode: bool = field(
-        default_factory=lambda: os.getenv("MCP_DEV_MODE", "").lower() == "true"
-    )
-    reload: bool = field(
-        default_factory=lambda: os.getenv("MCP_RELOAD", "").lower() == "true"
+    dev_mode: bool = _env_field("MCP_DEV_MODE", False)
+    reload: bool = _env_field("MCP_RELOAD", False)
+    
+    # (log_level, log_file) most recently passed to dictConfig
+    _last_logging_sig: ClassVar[Optional[Tuple[LogLevel, Optional[str]]]] = None
+    
+    # Last validate() field snapshot and the field check errors for it
+    _validate_cache: Optional[Tuple[Tuple[Any, ...], List[str]]] = field(
+        default=None, init=False, repr=False, compare=False
     )
 
     @classmethod
@@ -165,34 +295,61 @@ class ServerConfig:
         config_dict = {k: v for k, v in kwargs.items() if v is not None}
         
         # Load from environment with type conversion
+        env = os.environ
         env_updates: Dict[str, Any] = {}
-        for env_var, config_key in ENV_MAPPINGS.items():
-            if value := os.getenv(env_var):
-                try:
-                    if config_key in ("port", "max_resource_size"):
-                        env_updates[config_key] = int(value)
-                    elif config_key in ("enabled_plugins", "allowed_origins"):
-                        env_updates[config_key] = value.split(",")
-                    elif config_key in ("dev_mode", "reload"):
-                        env_updates[config_key] = value.lower() == "true"
-                    elif config_key == "plugin_dir":
-                        env_updates[config_key] = Path(value)
-                    elif config_key == "log_level":
-                        env_updates[config_key] = LogLevel.from_string(value)
-                    else:
-                        env_updates[config_key] = value
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"Invalid value for {env_var}: {e}")
+        for env_var in ENV_MAPPINGS.keys() & env.keys():
+            value = env[env_var]
+            if not value:
+                continue
+            config_key = ENV_MAPPINGS[env_var]
+            converter = ENV_CONVERTERS.get(config_key)
+            try:
+                env_updates[config_key] = converter(value) if converter else value
+            except (ValueError, TypeError) as e:
+                logger.warning("Invalid value for %s: %s", env_var, e)
 
         # Environment overrides kwargs
         config_dict.update(env_updates)
         
-        instance = cls(**config_dict)
+        # Fields still unset get their fallbacks here, so the field default
+        # factories neither query the environment again nor trip over a
+        # value that was just skipped as empty or invalid
+        for config_key, value in ENV_DEFAULTS.items():
+            config_dict.setdefault(config_key, value)
+        
+        instance = cls.from_untyped(**config_dict)
         if errors := instance.validate():
             raise ValidationError("\n".join(errors))
             
         return instance
 
+    @classmethod
+    def from_untyped(cls, **raw: Any) -> 'ServerConfig':
+        """Create config from values that may still be plain strings.
+        
+        The constructor trusts its arguments; this converts path strings to
+        Path objects and log level strings to LogLevel first. Values that
+        already have the right type are passed through.
+        
+        Args:
+            **raw: Config values, e.g. parsed from JSON
+            
+        Returns:
+            ServerConfig instance (not validated)
+        """
+        plugin_dir = raw.get("plugin_dir")
+        if isinstance(plugin_dir, str):
+            raw["plugin_dir"] = Path(plugin_dir)
+        if "resource_paths" in raw:
+            raw["resource_paths"] = [
+                p if isinstance(p, Path) else Path(p)
+                for p in raw["resource_paths"]
+            ]
+        log_level = raw.get("log_level")
+        if isinstance(log_level, str) and not isinstance(log_level, LogLevel):
+            raw["log_level"] = LogLevel.from_string(log_level)
+        return cls(**raw)
+
     @classmethod
     def from_file(cls, path: Path) -> 'ServerConfig':
         """Load configuration from a JSON file.
@@ -208,21 +365,12 @@ class ServerConfig:
             ValidationError: If config is invalid
         """
         try:
-            config_dict = json.loads(path.read_text())
+            st = path.stat()
+            config_dict = copy.deepcopy(
+                _load_json_cached(str(path), st.st_mtime_ns, st.st_size)
+            )
             
-            # Convert path strings to Path objects
-            if "plugin_dir" in config_dict:
-                config_dict["plugin_dir"] = Path(config_dict["plugin_dir"])
-            if "resource_paths" in config_dict:
-                config_dict["resource_paths"] = [
-                    Path(p) for p in config_dict["resource_paths"]
-                ]
-            if "log_level" in config_dict:
-                config_dict["log_level"] = LogLevel.from_string(
-                    config_dict["log_level"]
-                )
-                
-            instance = cls(**config_dict)
+            instance = cls.from_untyped(**config_dict)
             if errors := instance.validate():
                 raise ValidationError("\n".join(errors))
                 
@@ -243,8 +391,8 @@ class ServerConfig:
             ConfigError: If file cannot be written
         """
         try:
-            # Convert to dict, handling Path objects
-            config_dict = asdict(self)
+            # Shallow snapshot; only the Path and enum fields need converting
+            config_dict = {name: getattr(self, name) for name in _SAVED_FIELDS}
             config_dict["resource_paths"] = [
                 str(p) for p in self.resource_paths
             ]
@@ -252,7 +400,8 @@ class ServerConfig:
                 config_dict["plugin_dir"] = str(self.plugin_dir)
             config_dict["log_level"] = self.log_level.value
             
-            atomic_write(path, json.dumps(config_dict, indent=2))
+            atomic_write(path, _dumps_json(config_dict))
+            _load_json_cached.cache_clear()
             
         except Exception as e:
             raise ConfigError(f"Failed to save config to {path}: {e}")
@@ -262,6 +411,31 @@ class ServerConfig:
         
         Returns:
             List of validation error messages (empty if valid)
+            
+        Results of the field checks are reused while those fields are
+        unchanged; paths are checked against the filesystem on every call.
+        """
+        key = (
+            self.name,
+            self.description,
+            self.port,
+            self.health_check_interval,
+            self.status_check_interval,
+        )
+        if self._validate_cache is not None and self._validate_cache[0] == key:
+            errors = list(self._validate_cache[1])
+        else:
+            errors = self._field_errors()
+            self._validate_cache = (key, list(errors))
+            
+        errors.extend(self._path_errors())
+        return errors
+
+    def _field_errors(self) -> List[str]:
+        """Check the settings that don't depend on the filesystem.
+        
+        Returns:
+            List of validation error messages
         """
         errors = []
         
@@ -269,56 +443,98 @@ class ServerConfig:
         if not self.name:
             errors.append("Server name is required")
         else:
-            is_valid, error = check_package_name(self.name)
-            if not is_valid:
-                errors.append(f"Invalid server name: {error}")
+            result = check_package_name(self.name)
+            if not result.is_valid:
+                errors.append(f"Invalid server name: {result.message}")
 
         # Validate description
         if self.description:
-            is_valid, error = validate_description(self.description)
-            if not is_valid:
-                errors.append(f"Invalid description: {error}")
+            result = validate_description(self.description)
+            if not result.is_valid:
+                errors.append(f"Invalid description: {result.message}")
 
         # Validate network settings
         if not 1 <= self.port <= 65535:
             errors.append(f"Port must be between 1 and 65535, got {self.port}")
             
-        # Validate paths exist
+        # Validate monitoring intervals
+        if self.health_check_interval < 0:
+            errors.append(
+                f"Health check interval cannot be negative, "
+                f"got {self.health_check_interval}"
+            )
+        if self.status_check_interval < 0:
+            errors.append(
+                f"Status check interval cannot be negative, "
+                f"got {self.status_check_interval}"
+            )
+        return errors
+
+    def _path_errors(self) -> List[str]:
+        """Check that resource paths and enabled plugins exist.
+        
+        Returns:
+            List of validation error messages
+        """
+        errors = []
+        
+        # Validate paths exist, listing each parent directory once. A name
+        # missing from the listing, or listed as a symlink, is confirmed
+        # with a stat, which also covers case-insensitive filesystems.
+        listings: Dict[Path, Optional[Set[str]]] = {}
         for path in self.resource_paths:
+            parent = path.parent
+            if parent not in listings:
+                listings[parent] = _list_dir(parent)
+            names = listings[parent]
+            if names is not None and path.name in names:
+                continue
             if not path.exists():
                 errors.append(f"Resource path does not exist: {path}")
                 
         # Validate plugin configuration
         if self.plugin_dir:
-            if not self.plugin_dir.exists():
+            # Only read the directory when there are plugin files to look up
+            plugin_names = (
+                _list_dir(self.plugin_dir) if self.enabled_plugins else None
+            )
+            if plugin_names is None and not self.plugin_dir.exists():
                 errors.append(f"Plugin directory does not exist: {self.plugin_dir}")
                 
             # Check enabled plugins exist
             for plugin in self.enabled_plugins:
-                plugin_file = self.plugin_dir / f"{plugin}.py"
+                filename = f"{plugin}.py"
+                if plugin_names is not None and filename in plugin_names:
+                    continue
+                plugin_file = self.plugin_dir / filename
                 if not plugin_file.exists():
                     errors.append(f"Plugin file not found: {plugin_file}")
                     
         return errors
 
     def setup_logging(self) -> None:
-        """Configure logging based on settings."""
+        """Configure logging based on settings.
+        
+        Does nothing if logging is already configured with the same level
+        and log file, so reloads don't recreate the handlers.
+        """
+        sig = (self.log_level, self.log_file)
+        if sig == ServerConfig._last_logging_sig:
+            return
+            
+        level = self.log_level.to_python_level()
         log_config = {
             'version': 1,
-            'formatters': {
-                'default': {
-                    'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-                }
-            },
+            'formatters': LOG_FORMATTERS,
             'handlers': {
                 'console': {
                     'class': 'logging.StreamHandler',
                     'formatter': 'default',
-                    'level': self.log_level.to_python_level()
+                    'level': level
                 }
             },
             'root': {
-                'level': self.log_level.to_python_level(),
+                'level': level,
                 'handlers': ['console']
             }
         }
@@ -334,13 +550,14 @@ class ServerConfig:
                     'class': 'logging.FileHandler',
                     'filename': self.log_file,
                     'formatter': 'default',
-                    'level': self.log_level.to_python_level()
+                    'level': level
                 }
                 log_config['root']['handlers'].append('file')
             except OSError as e:
-                logger.error(f"Failed to setup file logging: {e}")
+                logger.error("Failed to setup file logging: %s", e)
             
         logging.config.dictConfig(log_config)
+        ServerConfig._last_logging_sig = sig
 
     def update(self, updates: ConfigDict) -> None:
         """Update config with new values.
@@ -351,15 +568,22 @@ class ServerConfig:
         Raises:
             ValidationError: If updates would make config invalid
         """
-        # Create temporary copy for validation
-        updated = asdict(self)
-        updated.update(updates)
-        
-        # Try to create new instance with updates
-        temp_instance = self.__class__(**updated)
+        # Validate a shallow copy with the updates applied
+        temp_instance = replace(self, **updates)
         if errors := temp_instance.validate():
             raise ValidationError("\n".join(errors))
             
         # Apply valid updates
         for key, value in updates.items():
-            setattr(self, key, value)
\ No newline at end of file
+            setattr(self, key, value)
+
+# Fields written by ServerConfig.to_file (excludes internal caches)
+_SAVED_FIELDS = tuple(f.name for f in fields(ServerConfig) if f.init)
+
+# Values the environment-backed default factories fall back to when their
+# variable is unset
+ENV_DEFAULTS: Dict[str, Any] = {
+    f.name: f.metadata["env_default"]
+    for f in fields(ServerConfig)
+    if "env_default" in f.metadata
+}
@@ -14,37 +14,38 @@ import asyncio
 import logging
 import os
 import signal
-import subprocess
+import socket
 import sys
 import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List, Optional, Set
 
-import aiohttp
-import psutil
-from aiohttp import ClientError, ClientTimeout
+# psutil is imported where first used, so importing this module (e.g. for
+# config-only CLI commands) doesn't pay for it
+if TYPE_CHECKING:
+    import psutil
 
 from .config import ServerConfig
-from ..utils.process import (
-    ProcessError,
-    TimeoutError,
-    run_background_process,
-    kill_process,
-    wait_for_process
-)
+from ..utils.process import ProcessError, TimeoutError
 
 logger = logging.getLogger(__name__)
 
 # Constants
-HEALTH_CHECK_INTERVAL = 30  # seconds
-STATUS_CHECK_INTERVAL = 60  # seconds
 STARTUP_TIMEOUT = 30       # seconds
 SHUTDOWN_TIMEOUT = 5       # seconds
 HEALTH_CHECK_TIMEOUT = 5   # seconds
 MAX_MEMORY_MB = 500       # Maximum memory usage in MB
 MAX_CPU_PERCENT = 80      # Maximum CPU usage percent
+STDERR_TAIL_LINES = 50    # Server stderr lines kept for error reports
+STARTUP_POLL_INITIAL = 0.05  # seconds before the second startup probe
+STARTUP_POLL_MAX = 1.0       # cap for the growing startup probe delay
+STATUS_CACHE_TTL = 1.0    # seconds a sampled status is reused
+
+# Line uvicorn logs once the application is ready to serve
+READY_MARKER = "Application startup complete"
 
 class ServerError(Exception):
     """Base exception for server operations."""
@@ -62,14 +63,14 @@ class HealthCheckError(ServerError):
     """Raised when health check fails."""
     pass
 
-@dataclass
+@dataclass(slots=True)
 class ServerStatus:
     """Server status information."""
     running: bool
     pid: Optional[int]
     start_time: Optional[datetime]
     uptime: Optional[timedelta]
-    memory_usage: Optional[float]  # In MB
+    memory_usage: Optional[int]  # In whole MB
     cpu_percent: Optional[float]
     port: int
     error: Optional[str] = None
@@ -81,7 +82,7 @@ class ServerStatus:
             "pid": self.pid,
             "start_time": self.start_time.isoformat() if self.start_time else None,
             "uptime": str(self.uptime) if self.uptime else None,
-            "memory_usage": round(self.memory_usage, 1) if self.memory_usage else None,
+            "memory_usage": self.memory_usage,
             "cpu_percent": round(self.cpu_percent, 1) if self.cpu_percent else None,
             "port": self.port,
             "error": self.error
@@ -106,17 +107,37 @@ class ServerManager:
         self.path = path
         self.name = name
         self.config = config or ServerConfig(name=name)
-        self.process: Optional[subprocess.Popen] = None
+        self.process: Optional[asyncio.subprocess.Process] = None
+        
+        # Tasks forwarding server output to the log, and recent stderr lines
+        self._output_tasks: List[asyncio.Task] = []
+        self._stderr_tail: Deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+        
+        # Set when server output reports readiness or a stream closes
+        self._startup_signal = asyncio.Event()
+        
+        # Raw GET /health request, fixed when the server starts
+        self._health_request = b""
         
         # Background tasks
-        self._health_check_task: Optional[asyncio.Task] = None
-        self._status_monitor_task: Optional[asyncio.Task] = None
+        self._monitor_task: Optional[asyncio.Task] = None
+        
+        # Set to run the monitoring checks now without waiting
+        self._wake_monitor = asyncio.Event()
+        
+        # psutil handle and start time for the running server process
+        self._psutil_proc: Optional['psutil.Process'] = None
+        self._start_time: Optional[datetime] = None
+        
+        # Most recent running status and when it was sampled (monotonic)
+        self._last_status: Optional[ServerStatus] = None
+        self._last_status_ts = 0.0
         
         # Track child processes
-        self._child_processes: Set[psutil.Process] = set()
+        self._child_processes: Set['psutil.Process'] = set()
         
-        # Setup signal handlers
-        self._setup_signal_handlers()
+        # Shutdown task started by a termination signal
+        self._signal_stop_task: Optional[asyncio.Task] = None
 
     def __enter__(self) -> 'ServerManager':
         """Context manager entry."""
@@ -135,15 +156,57 @@ class ServerManager:
         await self.stop()
 
     def _setup_signal_handlers(self) -> None:
-        """Setup signal handlers for graceful shutdown."""
+        """Setup signal handlers for graceful shutdown.
+        
+        Handlers are registered with the running event loop, so they run as
+        ordinary loop callbacks rather than interrupting arbitrary code.
+        """
         if sys.platform != "win32":
-            signal.signal(signal.SIGTERM, self._signal_handler)
-            signal.signal(signal.SIGINT, self._signal_handler)
+            loop = asyncio.get_running_loop()
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                loop.add_signal_handler(signum, self._signal_handler, signum)
 
-    def _signal_handler(self, signum: int, frame) -> None:
+    def _remove_signal_handlers(self) -> None:
+        """Remove the handlers installed by _setup_signal_handlers."""
+        if sys.platform != "win32":
+            loop = asyncio.get_running_loop()
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                loop.remove_signal_handler(signum)
+
+    def _signal_handler(self, signum: int) -> None:
         """Handle termination signals."""
         logger.info(f"Received signal {signum}")
-        asyncio.create_task(self.stop())
+        if self._signal_stop_task is None or self._signal_stop_task.done():
+            self._signal_stop_task = asyncio.create_task(self.stop())
+
+    async def _probe_health(self) -> int:
+        """Send GET /health to the server over a plain TCP connection.
+        
+        Returns:
+            HTTP status code of the response
+            
+        Raises:
+            OSError: If the connection fails
+            asyncio.TimeoutError: If no response arrives within
+                HEALTH_CHECK_TIMEOUT
+            ValueError: If the response has no valid status line
+        """
+        async def request() -> bytes:
+            reader, writer = await asyncio.open_connection(
+                self.config.host, self.config.port
+            )
+            try:
+                writer.write(self._health_request)
+                await writer.drain()
+                return await reader.readline()
+            finally:
+                writer.close()
+                
+        status_line = await asyncio.wait_for(request(), HEALTH_CHECK_TIMEOUT)
+        parts = status_line.split(None, 2)
+        if len(parts) < 2 or not parts[0].startswith(b"HTTP/"):
+            raise ValueError(f"Malformed status line: {status_line!r}")
+        return int(parts[1])
 
     async def start(self) -> None:
         """Start the server.
@@ -151,35 +214,68 @@ class ServerManager:
         Raises:
             ServerStartError: If server fails to start
         """
-        if self.process and self.process.poll() is None:
+        if self.process and self.process.returncode is None:
             logger.warning("Server is already running")
+            self._wake_monitors()
             return
 
         # Check if port is available
-        if not await self._is_port_available(self.config.port):
+        if not self._is_port_available(self.config.port):
             raise ServerStartError(f"Port {self.config.port} is already in use")
 
+        self._setup_signal_handlers()
+        
+        self._health_request = (
+            f"GET /health HTTP/1.1\r\n"
+            f"Host: {self.config.host}:{self.config.port}\r\n"
+            f"Connection: close\r\n\r\n"
+        ).encode("ascii")
+        
         try:
             # Prepare environment
-            env = os.environ.copy()
-            env.update({
+            env = {
+                **os.environ,
                 "MCP_SERVER_PORT": str(self.config.port),
                 "MCP_SERVER_HOST": self.config.host,
                 "MCP_LOG_LEVEL": self.config.log_level.value,
-            })
-
-            # Start server process
-            self.process = run_background_process(
-                ["uv", "run", "uvicorn",
-                 f"{self.name}.server:app",
-                 "--host", self.config.host,
-                 "--port", str(self.config.port),
-                 "--reload" if self.config.reload else "",
-                 "--log-level", self.config.log_level.value.lower()],
-                cwd=self.path,
-                env=env
+            }
+
+            argv = [
+                "uv", "run", "uvicorn",
+                f"{self.name}.server:app",
+                "--host", self.config.host,
+                "--port", str(self.config.port),
+                "--log-level", self.config.log_level.value.lower(),
+            ]
+            if self.config.reload:
+                argv.append("--reload")
+            
+            # Start server process, in its own session for cleanup
+            self.process = await asyncio.create_subprocess_exec(
+                *argv,
+                cwd=str(self.path),
+                env=env,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=sys.platform != "win32"
             )
             
+            # Keep both pipes drained so a chatty server can't block on them
+            self._stderr_tail.clear()
+            self._startup_signal.clear()
+            self._output_tasks = [
+                asyncio.create_task(
+                    self._drain(self.process.stdout, logger.info)
+                ),
+                asyncio.create_task(
+                    self._drain(
+                        self.process.stderr,
+                        logger.warning,
+                        self._stderr_tail
+                    )
+                ),
+            ]
+            
             logger.info(
                 f"Starting server {self.name} on "
                 f"{self.config.host}:{self.config.port} "
@@ -189,6 +285,9 @@ class ServerManager:
             # Wait for server to start
             await self._wait_for_startup()
             
+            # Prime CPU sampling so the first status check reports a real value
+            self._prime_process_metrics()
+            
             # Start monitoring tasks
             self._start_monitoring()
             
@@ -198,37 +297,91 @@ class ServerManager:
 
     async def stop(self) -> None:
         """Stop the server gracefully."""
+        self._remove_signal_handlers()
         if not self.process:
             return
 
         logger.info(f"Stopping server {self.name}")
         
         # Stop monitoring tasks
-        self._stop_monitoring()
+        await self._stop_monitoring()
 
         try:
-            # Stop child processes first
-            for proc in self._child_processes:
-                try:
-                    proc.terminate()
-                except psutil.NoSuchProcess:
-                    pass
+            import psutil
+            
+            # Stop child processes first; on POSIX one signal to the
+            # server's process group reaches all of them
+            if not self._signal_process_group(signal.SIGTERM):
+                for proc in self._child_processes:
+                    try:
+                        proc.terminate()
+                    except psutil.NoSuchProcess:
+                        pass
                     
-            # Wait for child processes
-            psutil.wait_procs(
-                list(self._child_processes),
-                timeout=SHUTDOWN_TIMEOUT
-            )
+            # Wait for child processes off the event loop
+            if self._child_processes:
+                await asyncio.to_thread(
+                    psutil.wait_procs,
+                    list(self._child_processes),
+                    timeout=SHUTDOWN_TIMEOUT
+                )
             
             # Stop main process
-            kill_process(self.process, timeout=SHUTDOWN_TIMEOUT)
+            await self._terminate_process()
                 
         except Exception as e:
             raise ServerStopError(f"Failed to stop server: {e}")
         finally:
+            for task in self._output_tasks:
+                task.cancel()
+            self._output_tasks = []
             self.process = None
+            self._psutil_proc = None
+            self._start_time = None
+            self._last_status = None
             self._child_processes.clear()
 
+    async def _terminate_process(self) -> None:
+        """Terminate the server process, killing it if it doesn't exit in time."""
+        if self.process.returncode is not None:
+            return
+        try:
+            self.process.terminate()
+            try:
+                await asyncio.wait_for(
+                    self.process.wait(),
+                    timeout=SHUTDOWN_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Process did not terminate gracefully, forcing..."
+                )
+                if not self._signal_process_group(signal.SIGKILL):
+                    self.process.kill()
+                await self.process.wait()
+        except ProcessLookupError:
+            pass  # Process already gone
+
+    def _signal_process_group(self, signum: int) -> bool:
+        """Send a signal to the server's whole process group.
+        
+        The server is started in its own session, so its pid is also the
+        group id of every process it spawns.
+        
+        Args:
+            signum: Signal to send
+            
+        Returns:
+            True if handled at group level, False on Windows
+        """
+        if sys.platform == "win32":
+            return False
+        try:
+            os.killpg(self.process.pid, signum)
+        except ProcessLookupError:
+            pass  # Group already gone
+        return True
+
     async def restart(self) -> None:
         """Restart the server gracefully."""
         await self.stop()
@@ -239,8 +392,11 @@ class ServerManager:
         
         Returns:
             ServerStatus object with current metrics
+            
+        Metrics of a running server are sampled at most once per
+        STATUS_CACHE_TTL; faster callers get the latest sample.
         """
-        if not self.process or self.process.poll() is not None:
+        if not self.process or self.process.returncode is not None:
             return ServerStatus(
                 running=False,
                 pid=None,
@@ -251,19 +407,32 @@ class ServerManager:
                 port=self.config.port
             )
 
+        now = time.monotonic()
+        if (
+            self._last_status is not None
+            and now - self._last_status_ts < STATUS_CACHE_TTL
+        ):
+            return self._last_status
+            
+        import psutil
+        
         try:
-            proc = psutil.Process(self.process.pid)
-            start_time = datetime.fromtimestamp(proc.create_time())
+            proc = self._get_psutil_process()
+            with proc.oneshot():
+                memory_info = proc.memory_info()
+                cpu_percent = proc.cpu_percent()
             
-            return ServerStatus(
+            self._last_status = ServerStatus(
                 running=True,
                 pid=self.process.pid,
-                start_time=start_time,
-                uptime=datetime.now() - start_time,
-                memory_usage=proc.memory_info().rss / 1024 / 1024,
-                cpu_percent=proc.cpu_percent(),
+                start_time=self._start_time,
+                uptime=datetime.now() - self._start_time,
+                memory_usage=memory_info.rss >> 20,
+                cpu_percent=cpu_percent,
                 port=self.config.port
             )
+            self._last_status_ts = now
+            return self._last_status
             
         except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
             return ServerStatus(
@@ -277,24 +446,54 @@ class ServerManager:
                 error=str(e)
             )
 
-    async def _is_port_available(self, port: int) -> bool:
+    def _get_psutil_process(self) -> 'psutil.Process':
+        """Get the psutil handle for the server process, creating it once.
+        
+        Reusing one handle avoids re-validating the pid on every status
+        check and lets cpu_percent() measure since the previous call.
+        
+        Returns:
+            psutil Process for the running server
+            
+        Raises:
+            psutil.NoSuchProcess: If the process no longer exists
+            psutil.AccessDenied: If the process cannot be inspected
+        """
+        if self._psutil_proc is None or self._psutil_proc.pid != self.process.pid:
+            import psutil
+            
+            proc = psutil.Process(self.process.pid)
+            self._start_time = datetime.fromtimestamp(proc.create_time())
+            self._psutil_proc = proc
+        return self._psutil_proc
+
+    def _prime_process_metrics(self) -> None:
+        """Create the psutil handle and take the first cpu_percent() sample."""
+        import psutil
+        
+        try:
+            self._get_psutil_process().cpu_percent(None)
+        except psutil.Error as e:
+            logger.debug("Could not prime process metrics: %s", e)
+
+    def _is_port_available(self, port: int) -> bool:
         """Check if a port is available.
         
         Args:
             port: Port number to check
             
         Returns:
-            True if port is available, False if in use
+            True if the port can be bound on the configured host, False if in use
         """
-        timeout = ClientTimeout(total=1)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(
-                    f"http://localhost:{port}/health"
-                ) as _:
-                    return False  # Port is in use
-        except:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((self.config.host, port))
             return True
+        except OSError:
+            return False
+        finally:
+            sock.close()
 
     async def _wait_for_startup(self) -> None:
         """Wait for server to start and verify it's running.
@@ -302,100 +501,186 @@ class ServerManager:
         Raises:
             ServerStartError: If server fails to start within timeout
         """
-        start_time = time.time()
+        deadline = time.monotonic_ns() + STARTUP_TIMEOUT * 1_000_000_000
         last_error = None
-        health_check_url = f"http://{self.config.host}:{self.config.port}/health"
-        
-        timeout = ClientTimeout(total=HEALTH_CHECK_TIMEOUT)
+        delay = STARTUP_POLL_INITIAL
         
-        while (time.time() - start_time) < STARTUP_TIMEOUT:
+        while time.monotonic_ns() < deadline:
             # Check if process died
-            if self.process.poll() is not None:
-                stdout, stderr = self.process.communicate()
+            if self.process.returncode is not None:
+                # Let the drain tasks reach EOF so the stderr tail is complete
+                await asyncio.gather(*self._output_tasks, return_exceptions=True)
+                stderr = "\n".join(self._stderr_tail)
                 raise ServerStartError(
-                    f"Server process terminated unexpectedly:\n"
-                    f"stdout: {stdout}\nstderr: {stderr}"
+                    f"Server process terminated unexpectedly "
+                    f"(exit code {self.process.returncode}):\n"
+                    f"stderr: {stderr}"
                 )
 
             # Check health endpoint
             try:
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.get(health_check_url) as response:
-                        if response.status == 200:
-                            logger.info(f"Server {self.name} started successfully")
-                            return
-                        last_error = f"Health check failed with status {response.status}"
+                status = await self._probe_health()
+                if status == 200:
+                    logger.info(f"Server {self.name} started successfully")
+                    return
+                last_error = f"Health check failed with status {status}"
             except Exception as e:
                 last_error = str(e)
 
-            await asyncio.sleep(0.5)
+            # Probe again as soon as the output reports readiness or the
+            # process closes its streams, polling with a growing delay as a
+            # fallback (the marker is not logged at warning level and above)
+            await self._wait_interval(self._startup_signal, delay)
+            delay = min(delay * 1.5, STARTUP_POLL_MAX)
 
         raise ServerStartError(
             f"Server failed to start within {STARTUP_TIMEOUT} seconds: {last_error}"
         )
 
+    async def _drain(
+        self,
+        stream: asyncio.StreamReader,
+        log: Callable[..., None],
+        tail: Optional[Deque[str]] = None
+    ) -> None:
+        """Forward a server output stream to the log until EOF.
+        
+        Sets the startup signal when the readiness line appears and when
+        the stream closes.
+        
+        Args:
+            stream: Process stdout or stderr
+            log: Logger method for each line
+            tail: Optional buffer receiving the most recent lines
+        """
+        while True:
+            try:
+                raw = await stream.readline()
+            except ValueError:
+                continue  # Overlong line, already discarded by the reader
+            if not raw:
+                break
+            line = raw.decode(errors="replace").rstrip()
+            log("[server] %s", line)
+            if tail is not None:
+                tail.append(line)
+            if READY_MARKER in line:
+                self._startup_signal.set()
+        self._startup_signal.set()
+
     def _start_monitoring(self) -> None:
-        """Start background monitoring tasks."""
-        if not self._health_check_task:
-            self._health_check_task = asyncio.create_task(
-                self._health_check_loop()
-            )
-        if not self._status_monitor_task:
-            self._status_monitor_task = asyncio.create_task(
-                self._status_monitor_loop()
-            )
+        """Start the background monitoring task.
+        
+        Not started when both intervals are configured as 0.
+        """
+        if self._monitor_task:
+            return
+        if self.config.health_check_interval or self.config.status_check_interval:
+            self._monitor_task = asyncio.create_task(self._monitor_loop())
 
-    def _stop_monitoring(self) -> None:
-        """Stop background monitoring tasks."""
-        if self._health_check_task:
-            self._health_check_task.cancel()
-            self._health_check_task = None
-        if self._status_monitor_task:
-            self._status_monitor_task.cancel()
-            self._status_monitor_task = None
+    def _wake_monitors(self) -> None:
+        """Run the monitoring checks now instead of after their interval."""
+        self._wake_monitor.set()
 
-    async def _health_check_loop(self) -> None:
-        """Periodic health check loop."""
-        health_check_url = f"http://{self.config.host}:{self.config.port}/health"
-        timeout = ClientTimeout(total=HEALTH_CHECK_TIMEOUT)
+    @staticmethod
+    async def _wait_interval(wake: asyncio.Event, interval: float) -> bool:
+        """Sleep until the interval passes or the wake event is set.
         
-        while True:
-            try:
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.get(health_check_url) as response:
-                        if response.status != 200:
-                            logger.warning(
-                                f"Health check failed: {response.status}"
-                            )
-                            await self._handle_health_failure("Bad status")
-            except Exception as e:
-                logger.error(f"Health check failed: {e}")
-                await self._handle_health_failure(str(e))
+        Args:
+            wake: Event that ends the wait early
+            interval: Maximum time to wait in seconds
             
-            await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+        Returns:
+            True if the wait ended because the event was set
+        """
+        try:
+            await asyncio.wait_for(wake.wait(), timeout=interval)
+            woken = True
+        except asyncio.TimeoutError:
+            woken = False
+        wake.clear()
+        return woken
+
+    async def _stop_monitoring(self) -> None:
+        """Stop the background monitoring task and wait for it to finish."""
+        task = self._monitor_task
+        self._monitor_task = None
+        if task is None or task is asyncio.current_task():
+            return
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
 
-    async def _status_monitor_loop(self) -> None:
-        """Periodic status monitoring loop."""
+    async def _monitor_loop(self) -> None:
+        """Periodic health check and status monitoring loop.
+        
+        Both checks share one task and one wakeup; each runs when its own
+        interval has elapsed. A failed health check also samples status
+        immediately.
+        """
+        health_interval = self.config.health_check_interval
+        status_interval = self.config.status_check_interval
+        next_health = next_status = time.monotonic()
+        
         while True:
-            try:
-                status = await self.get_status()
+            now = time.monotonic()
+            healthy = True
+            if health_interval and now >= next_health:
+                healthy = await self._check_health()
+                next_health = now + health_interval
+            if status_interval and (now >= next_status or not healthy):
+                await self._check_status()
+                next_status = now + status_interval
                 
-                # Check memory usage
-                if status.memory_usage and status.memory_usage > MAX_MEMORY_MB:
-                    logger.warning(
-                        f"High memory usage: {status.memory_usage:.1f}MB"
-                    )
-                    
-                # Check CPU usage
-                if status.cpu_percent and status.cpu_percent > MAX_CPU_PERCENT:
-                    logger.warning(
-                        f"High CPU usage: {status.cpu_percent:.1f}%"
-                    )
-                    
-            except Exception as e:
-                logger.error(f"Status monitoring failed: {e}")
+            deadline = min(
+                due
+                for due, interval in (
+                    (next_health, health_interval),
+                    (next_status, status_interval),
+                )
+                if interval
+            )
+            if await self._wait_interval(
+                self._wake_monitor,
+                max(0.0, deadline - time.monotonic())
+            ):
+                next_health = next_status = time.monotonic()
+
+    async def _check_health(self) -> bool:
+        """Probe the health endpoint once.
+        
+        Returns:
+            True if the server responded with status 200
+        """
+        try:
+            status = await self._probe_health()
+            if status == 200:
+                return True
+            logger.warning(f"Health check failed: {status}")
+            await self._handle_health_failure("Bad status")
+        except Exception as e:
+            logger.error(f"Health check failed: {e}")
+            await self._handle_health_failure(str(e))
+        return False
+
+    async def _check_status(self) -> None:
+        """Sample process metrics once and warn about high usage."""
+        try:
+            status = await self.get_status()
             
-            await asyncio.sleep(STATUS_CHECK_INTERVAL)
+            # Check memory usage
+            if status.memory_usage and status.memory_usage > MAX_MEMORY_MB:
+                logger.warning(
+                    f"High memory usage: {status.memory_usage}MB"
+                )
+                
+            # Check CPU usage
+            if status.cpu_percent and status.cpu_percent > MAX_CPU_PERCENT:
+                logger.warning(
+                    f"High CPU usage: {status.cpu_percent:.1f}%"
+                )
+                
+        except Exception as e:
+            logger.error(f"Status monitoring failed: {e}")
 
     async def _handle_health_failure(self, reason: str) -> None:
         """Handle health check failure.
@@ -14,10 +14,15 @@ Key concepts:
 """
 
 import abc
+import ast
 import asyncio
+import hashlib
 import importlib
+import json
 import logging
-from dataclasses import dataclass
+import os
+from dataclasses import asdict, dataclass
+from itertools import chain
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Protocol, Set, Type
 
@@ -25,6 +30,18 @@ from .core import ResourceInfo, ResourceProvider, Tool, ServerError
 
 logger = logging.getLogger(__name__)
 
+# Directory under the user cache directory holding discovery results,
+# one file per plugin directory
+DISCOVERY_CACHE_DIR = "mcp-server-plugins"
+
+# Members a class must have to implement PluginInterface. The protocol
+# can't be checked with issubclass(): it isn't runtime_checkable, and its
+# name and version members would make issubclass() raise even if it were.
+PLUGIN_MEMBERS = (
+    "name", "version", "setup", "start", "stop",
+    "get_resource_providers", "get_tools",
+)
+
 class PluginError(ServerError):
     """Base exception for plugin-related errors."""
     pass
@@ -106,39 +123,174 @@ class PluginManager:
             
         This scans the plugin directory for Python modules and looks for
         plugin implementation classes that provide the PluginInterface.
+        Files are inspected concurrently in the default executor, so slow
+        plugin imports don't block the event loop or each other. Results are
+        cached per file modification time, so unchanged files are neither
+        parsed nor imported on later runs.
         """
-        metadata = []
+        cache = self._load_discovery_cache()
+        new_cache: Dict[str, Dict[str, Any]] = {}
+        found: Dict[str, Optional[List[PluginMetadata]]] = {}
+        pending: Dict[str, asyncio.Future] = {}
+        loop = asyncio.get_running_loop()
         
         for plugin_file in self.plugin_dir.glob("*.py"):
             if plugin_file.name.startswith("_"):
                 continue
-                
+            key = str(plugin_file)
             try:
-                # Load module
-                spec = importlib.util.spec_from_file_location(
-                    plugin_file.stem, plugin_file
+                mtime_ns = plugin_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue  # Deleted since the directory was listed
+            found[key] = self._cached_plugins(cache.get(key), mtime_ns)
+            if found[key] is None:
+                pending[key] = loop.run_in_executor(
+                    None, self._discover_in_file, plugin_file
                 )
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                
-                # Find plugin class
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (isinstance(attr, type) and 
-                        attr_name.endswith("Plugin") and
-                        issubclass(attr, PluginInterface)):
-                        
-                        metadata.append(PluginMetadata(
-                            name=attr.name,
-                            version=attr.version,
-                            path=plugin_file,
-                            module_name=plugin_file.stem,
-                            plugin_class=attr_name
-                        ))
-                        
-            except Exception as e:
-                logger.error(f"Failed to load plugin {plugin_file}: {e}")
+            new_cache[key] = {"mtime_ns": mtime_ns}
+            
+        for key, result in zip(pending, await asyncio.gather(*pending.values())):
+            found[key] = result
+            
+        metadata = []
+        for key, plugins in found.items():
+            if plugins is None:
+                del new_cache[key]  # Failed; retry next time
+                continue
+            new_cache[key]["plugins"] = [
+                self._metadata_to_dict(item) for item in plugins
+            ]
+            metadata.extend(plugins)
+            
+        if new_cache != cache:
+            self._save_discovery_cache(new_cache)
+        return metadata
+        
+    def _cached_plugins(
+        self,
+        entry: Any,
+        mtime_ns: int
+    ) -> Optional[List[PluginMetadata]]:
+        """Get a file's plugins from its cache entry.
+        
+        Returns:
+            Cached metadata, or None if the entry is missing, outdated or
+            malformed and the file has to be inspected again
+        """
+        try:
+            if entry is None or entry["mtime_ns"] != mtime_ns:
+                return None
+            return [self._metadata_from_dict(item) for item in entry["plugins"]]
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+            
+    def _discovery_cache_path(self) -> Path:
+        """Locate the discovery cache for this plugin directory.
+        
+        The cache lives in the user cache directory ($XDG_CACHE_HOME or
+        ~/.cache), never in the plugin source tree.
+        """
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        digest = hashlib.sha256(
+            str(self.plugin_dir.resolve()).encode("utf-8")
+        ).hexdigest()[:16]
+        return Path(cache_home, DISCOVERY_CACHE_DIR, f"{digest}.json")
+        
+    def _load_discovery_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Read the discovery cache, returning an empty one if unusable."""
+        try:
+            with open(self._discovery_cache_path(), "rb") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+        
+    def _save_discovery_cache(self, cache: Dict[str, Dict[str, Any]]) -> None:
+        """Write the discovery cache, ignoring failures (it's only a cache)."""
+        path = self._discovery_cache_path()
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not write plugin discovery cache: {e}")
+            tmp_path.unlink(missing_ok=True)
+            
+    @staticmethod
+    def _metadata_to_dict(metadata: PluginMetadata) -> Dict[str, Any]:
+        """Convert plugin metadata to a JSON-serializable dict."""
+        data = asdict(metadata)
+        data["path"] = str(metadata.path)
+        if metadata.dependencies is not None:
+            data["dependencies"] = sorted(metadata.dependencies)
+        return data
+        
+    @staticmethod
+    def _metadata_from_dict(data: Dict[str, Any]) -> PluginMetadata:
+        """Rebuild plugin metadata from its cached dict form."""
+        dependencies = data.get("dependencies")
+        return PluginMetadata(**{
+            **data,
+            "path": Path(data["path"]),
+            "dependencies": set(dependencies) if dependencies is not None else None,
+        })
+        
+    def _discover_in_file(
+        self,
+        plugin_file: Path
+    ) -> Optional[List[PluginMetadata]]:
+        """Find plugin classes defined in one module.
+        
+        Args:
+            plugin_file: Python file in the plugin directory
+            
+        Returns:
+            Metadata for each plugin class in the file, or None on failure
+            
+        The module is parsed first and only imported if it defines a class
+        whose name ends in "Plugin".
+        """
+        metadata = []
+        try:
+            # Find candidate classes without executing the module
+            tree = ast.parse(plugin_file.read_bytes(), str(plugin_file))
+            candidates = [
+                node.name
+                for node in tree.body
+                if isinstance(node, ast.ClassDef)
+                and node.name.endswith("Plugin")
+            ]
+            if not candidates:
+                return metadata
                 
+            # Load module
+            spec = importlib.util.spec_from_file_location(
+                plugin_file.stem, plugin_file
+            )
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            
+            # Find plugin class
+            for attr_name in candidates:
+                attr = getattr(module, attr_name, None)
+                if (isinstance(attr, type) and 
+                    all(hasattr(attr, member) for member in PLUGIN_MEMBERS)):
+                    
+                    metadata.append(PluginMetadata(
+                        name=attr.name,
+                        version=attr.version,
+                        path=plugin_file,
+                        module_name=plugin_file.stem,
+                        plugin_class=attr_name
+                    ))
+                    
+        except Exception as e:
+            logger.error(f"Failed to load plugin {plugin_file}: {e}")
+            return None
+            
         return metadata
         
     async def load_plugin(self, metadata: PluginMetadata) -> None:
@@ -168,44 +320,46 @@ class PluginManager:
             raise PluginError(f"Failed to load plugin {metadata.name}: {e}")
             
     async def start_plugins(self) -> None:
-        """Start all loaded plugins."""
+        """Start all loaded plugins concurrently."""
         if self._running:
             return
             
-        for name, plugin in self.plugins.items():
-            try:
-                await plugin.start()
-            except Exception as e:
-                logger.error(f"Failed to start plugin {name}: {e}")
+        results = await asyncio.gather(
+            *(plugin.start() for plugin in self.plugins.values()),
+            return_exceptions=True
+        )
+        for name, result in zip(self.plugins, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to start plugin {name}: {result}")
                 
         self._running = True
         
     async def stop_plugins(self) -> None:
-        """Stop all running plugins."""
+        """Stop all running plugins concurrently."""
         if not self._running:
             return
             
-        for name, plugin in self.plugins.items():
-            try:
-                await plugin.stop()
-            except Exception as e:
-                logger.error(f"Failed to stop plugin {name}: {e}")
+        results = await asyncio.gather(
+            *(plugin.stop() for plugin in self.plugins.values()),
+            return_exceptions=True
+        )
+        for name, result in zip(self.plugins, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to stop plugin {name}: {result}")
                 
         self._running = False
         
     def get_resource_providers(self) -> List[ResourceProvider]:
         """Get all resource providers from loaded plugins."""
-        providers = []
-        for plugin in self.plugins.values():
-            providers.extend(plugin.get_resource_providers())
-        return providers
+        return list(chain.from_iterable(
+            plugin.get_resource_providers() for plugin in self.plugins.values()
+        ))
         
     def get_tools(self) -> List[Tool]:
         """Get all tools from loaded plugins."""
-        tools = []
-        for plugin in self.plugins.values():
-            tools.extend(plugin.get_tools())
-        return tools
+        return list(chain.from_iterable(
+            plugin.get_tools() for plugin in self.plugins.values()
+        ))
 
 class BasePlugin(PluginInterface):
     """Base implementation of the plugin interface.
@@ -219,7 +373,7 @@ class BasePlugin(PluginInterface):
     
     def __init__(self):
         self._running = False
-        self._tasks: List[asyncio.Task] = []
+        self._tasks: Set[asyncio.Task] = set()
         
     async def setup(self) -> None:
         """Initialize plugin. Override in subclasses."""
@@ -233,10 +387,12 @@ class BasePlugin(PluginInterface):
         """Stop plugin operation."""
         self._running = False
         
-        # Cancel background tasks
-        for task in self._tasks:
-            task.cancel()
+        # Cancel background tasks and wait for them to finish
+        tasks = list(self._tasks)
         self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
         
     def get_resource_providers(self) -> List[ResourceProvider]:
         """Get plugin's resource providers."""
@@ -249,8 +405,11 @@ class BasePlugin(PluginInterface):
     def create_task(self, coro) -> asyncio.Task:
         """Create a managed background task.
         
-        The task will be automatically cancelled when the plugin stops.
+        The task will be automatically cancelled when the plugin stops, and
+        stop() waits for it to finish. Finished tasks are dropped as soon as
+        they complete.
         """
         task = asyncio.create_task(coro)
-        self._tasks.append(task)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
         return task
@@ -0,0 +1,63 @@
+"""Tests for the pyproject module.
+
+File: create_mcp_server/tests/core/test_pyproject.py
+
+This module contains tests for PyProject change tracking, covering:
+- Skipping saves when nothing changed
+- Saving edits made through the wrapper methods and the data attribute
+- Dependency de-duplication
+"""
+
+from pathlib import Path
+
+import pytest
+
+from create_mcp_server.core.pyproject import PyProject
+
+# Test fixtures
+@pytest.fixture
+def pyproject_path(tmp_path: Path) -> Path:
+    """Provide a freshly created pyproject.toml."""
+    path = tmp_path / "pyproject.toml"
+    PyProject.create_default(path, "demo", description="A demo MCP server")
+    return path
+
+def test_save_unchanged_skips_write(pyproject_path: Path):
+    """Test saving an unmodified project leaves the file alone."""
+    # A trailing blank line would be dropped if the file were rewritten
+    pyproject_path.write_text(pyproject_path.read_text() + "\n")
+    edited = pyproject_path.read_text()
+
+    PyProject(pyproject_path).save()
+
+    assert pyproject_path.read_text() == edited
+
+def test_save_after_update(pyproject_path: Path):
+    """Test changes made through the wrapper methods are saved."""
+    project = PyProject(pyproject_path)
+    project.update_metadata(version="0.2.0")
+    project.save()
+
+    assert PyProject(pyproject_path).metadata.version == "0.2.0"
+
+def test_save_after_direct_edit(pyproject_path: Path):
+    """Test changes made through the data attribute are saved."""
+    project = PyProject(pyproject_path)
+    project.data["project"]["version"] = "0.3.0"
+    project.save()
+
+    assert PyProject(pyproject_path).metadata.version == "0.3.0"
+
+def test_add_dependency_deduplicates(pyproject_path: Path):
+    """Test a dependency is only added once, even after direct edits."""
+    project = PyProject(pyproject_path)
+    project.add_dependency("mcp", version="1.0")
+    project.add_dependency("mcp", version="1.0")
+    assert project.data["project"]["dependencies"] == ["mcp>=1.0"]
+
+    project.data["project"]["dependencies"].clear()
+    project.add_dependency("mcp", version="1.0")
+    project.save()
+
+    deps = PyProject(pyproject_path).data["project"]["dependencies"]
+    assert deps == ["mcp>=1.0"]
@@ -0,0 +1,214 @@
+"""Tests for the template module.
+
+File: create_mcp_server/tests/core/test_template.py
+
+This module contains tests for ServerTemplate, covering:
+- Choosing between the precompiled bundle and the template sources
+- Rendering static and substitution-only templates without Jinja
+- Writing static templates
+"""
+
+import logging
+import os
+from pathlib import Path
+
+import pytest
+from jinja2 import FileSystemLoader, ModuleLoader
+
+from create_mcp_server.core import template
+from create_mcp_server.core.template import ServerTemplate
+from create_mcp_server.server.config import ServerConfig
+
+# One template per TEMPLATE_FILES entry, mixing static, simple and Jinja ones
+TEMPLATES = {
+    "server/main.py.jinja2": 'class MCPServer:\n    name = "{{ project_name }}"\n',
+    "server/__init__.py.jinja2": '"""{{ description }}"""\n',
+    "server/config.py.jinja2": 'PORT = {{ port }}\nHOST = "{{ host|upper }}"\n',
+    "server/core.py.jinja2": "# Core module\r\n",
+    "plugins/__init__.py.jinja2": "",
+    "plugins/example.py.jinja2": "{% if port %}PORT = {{ port }}{% endif %}\n",
+    "tests/__init__.py.jinja2": "# Tests\n",
+    "tests/test_server.py.jinja2": "{# Generated #}\ndef test_server():\n    pass\n",
+    "README.md.jinja2": "# {{ project_name }}\n\n{{ missing }}end\n",
+    "docs/api.md.jinja2": "# API\n",
+    "docs/usage.md.jinja2": "{{project_name}} listens on {{ port }}\n",
+}
+
+# Test fixtures
+@pytest.fixture(autouse=True)
+def fresh_caches(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep environments and validation results from leaking between tests."""
+    monkeypatch.setattr(ServerTemplate, "_ENV_CACHE", {})
+    monkeypatch.setattr(ServerTemplate, "_VALIDATED", set())
+
+@pytest.fixture
+def template_dir(tmp_path: Path) -> Path:
+    """Provide a template directory with every expected template."""
+    directory = tmp_path / "templates"
+    for name, source in TEMPLATES.items():
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(source.encode("utf-8"))
+    return directory
+
+@pytest.fixture
+def required_files(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Only require files generated in the package directory.
+
+    README.md is listed as required in the package directory, but it is
+    rendered at the project root.
+    """
+    monkeypatch.setattr(
+        ServerTemplate,
+        "REQUIRED_FILES",
+        ["server.py", "__init__.py", "config.py"]
+    )
+
+@pytest.fixture
+def config() -> ServerConfig:
+    """Provide a valid server configuration."""
+    return ServerConfig(
+        name="demo-server",
+        description="A demo server for tests",
+        host="127.0.0.1",
+        port=8123,
+    )
+
+@pytest.fixture
+def bundle(
+    tmp_path: Path,
+    template_dir: Path,
+    monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Precompile template_dir and make it the default template set."""
+    path = tmp_path / "templates.zip"
+    ServerTemplate.precompile(path, template_dir)
+    monkeypatch.setattr(template, "DEFAULT_TEMPLATE_DIR", template_dir)
+    monkeypatch.setattr(template, "COMPILED_TEMPLATES_PATH", path)
+    return path
+
+# Bundle selection tests
+def test_bundle_used_when_current(
+    bundle: Path,
+    template_dir: Path,
+    caplog: pytest.LogCaptureFixture
+):
+    """Test a bundle older than its sources is still used if they match."""
+    # Installers may write the bundle before the sources it was built from
+    mtime_ns = os.stat(bundle).st_mtime_ns + 10**9
+    for name in TEMPLATES:
+        os.utime(template_dir / name, ns=(mtime_ns, mtime_ns))
+
+    with caplog.at_level(logging.WARNING):
+        server_template = ServerTemplate()
+
+    assert isinstance(server_template.env.loader, ModuleLoader)
+    assert not caplog.records
+    rendered = server_template.env.get_template("server/config.py.jinja2")
+    assert rendered.render(port=1, host="h") == 'PORT = 1\nHOST = "H"\n'
+
+def test_bundle_ignored_when_outdated(
+    bundle: Path,
+    template_dir: Path,
+    caplog: pytest.LogCaptureFixture
+):
+    """Test a bundle built from other sources is ignored with a warning."""
+    (template_dir / "docs/api.md.jinja2").write_text("# Changed\n")
+
+    with caplog.at_level(logging.WARNING):
+        server_template = ServerTemplate()
+
+    assert isinstance(server_template.env.loader, FileSystemLoader)
+    assert "outdated template bundle" in caplog.text
+
+def test_bundle_without_digest_ignored(
+    bundle: Path,
+    template_dir: Path,
+    monkeypatch: pytest.MonkeyPatch
+):
+    """Test a bundle that doesn't record its sources is not trusted."""
+    jinja_only = bundle.with_name("jinja.zip")
+    ServerTemplate._build_env(
+        FileSystemLoader(str(template_dir))
+    ).compile_templates(str(jinja_only), zip="deflated")
+    monkeypatch.setattr(template, "COMPILED_TEMPLATES_PATH", jinja_only)
+
+    assert isinstance(ServerTemplate().env.loader, FileSystemLoader)
+
+# Fast path tests
+def test_templates_classified(template_dir: Path):
+    """Test each template is sorted into static, simple, or Jinja."""
+    server_template = ServerTemplate(template_dir)
+
+    assert set(server_template._static_templates) == {
+        "server/core.py.jinja2",
+        "plugins/__init__.py.jinja2",
+        "tests/__init__.py.jinja2",
+        "docs/api.md.jinja2",
+    }
+    assert set(server_template._simple_templates) == {
+        "server/main.py.jinja2",
+        "server/__init__.py.jinja2",
+        "README.md.jinja2",
+        "docs/usage.md.jinja2",
+    }
+    assert server_template._simple_templates["docs/usage.md.jinja2"] == [
+        "", "project_name", " listens on ", "port", "\n"
+    ]
+
+def test_fast_path_matches_jinja(template_dir: Path):
+    """Test templates rendered without Jinja match Jinja's output."""
+    server_template = ServerTemplate(template_dir)
+    context = {"project_name": "demo", "description": None, "port": 8123}
+
+    for name in TEMPLATES:
+        expected = server_template.env.get_template(name).render(context)
+        rendered = server_template._render_template(name, context)
+        assert rendered == expected.encode("utf-8"), name
+
+    # Undefined variables render as empty strings, as in Jinja
+    readme = server_template._render_template("README.md.jinja2", context)
+    assert readme == b"# demo\n\nend\n"
+
+# Static template tests
+def test_static_templates_written_atomically(
+    tmp_path: Path,
+    template_dir: Path,
+    config: ServerConfig,
+    required_files: None
+):
+    """Test static templates replace existing files instead of truncating."""
+    project_dir = tmp_path / "project"
+    package_dir = project_dir / "demo_server"
+    package_dir.mkdir(parents=True)
+    existing = package_dir / "core.py"
+    existing.write_text("old")
+    other_link = tmp_path / "core-link.py"
+    os.link(existing, other_link)
+
+    server_template = ServerTemplate(template_dir)
+    server_template.create_server(project_dir, config, package_dir)
+
+    # Same output as rendering through Jinja, which normalizes newlines
+    assert existing.read_bytes() == b"# Core module\n"
+    assert (package_dir / "plugins" / "__init__.py").read_bytes() == b""
+    assert (project_dir / "docs" / "api.md").read_text() == "# API\n"
+    # The old inode, still reachable through the other link, is untouched
+    assert other_link.read_text() == "old"
+    assert existing in server_template._generated_files
+
+def test_static_templates_cleaned_up(
+    tmp_path: Path,
+    template_dir: Path,
+    config: ServerConfig
+):
+    """Test static files already written are removed when creation fails."""
+    project_dir = tmp_path / "project"
+    package_dir = project_dir / "demo_server"
+
+    server_template = ServerTemplate(template_dir)
+    with pytest.raises(template.ValidationError):
+        server_template.create_server(project_dir, config, package_dir)
+
+    assert not (package_dir / "core.py").exists()
+    assert not (project_dir / "docs" / "api.md").exists()
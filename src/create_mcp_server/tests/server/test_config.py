@@ -0,0 +1,240 @@
+"""Tests for the server config module.
+
+File: create_mcp_server/tests/server/test_config.py
+
+This module contains tests for ServerConfig, covering:
+- Environment variable parsing and defaults
+- Saving to and loading from JSON files
+- Validation
+"""
+
+from pathlib import Path
+
+import pytest
+
+from create_mcp_server.server.config import (
+    ENV_DEFAULTS,
+    ENV_MAPPINGS,
+    ConfigError,
+    LogLevel,
+    ServerConfig,
+    ValidationError,
+)
+
+# The default "MCP Server" description is too short to validate
+DESCRIPTION = "A demo server for tests"
+
+# Test fixtures
+@pytest.fixture
+def clean_env(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    """Remove every MCP_* variable ServerConfig reads."""
+    for env_var in ENV_MAPPINGS:
+        monkeypatch.delenv(env_var, raising=False)
+    return monkeypatch
+
+# Environment tests
+def test_env_defaults_match_fields(clean_env: pytest.MonkeyPatch):
+    """Test ENV_DEFAULTS agrees with the field defaults."""
+    config = ServerConfig(name="demo", description=DESCRIPTION)
+    assert ENV_DEFAULTS == {
+        "host": "127.0.0.1",
+        "port": 8000,
+        "log_level": LogLevel.INFO,
+        "log_file": None,
+        "dev_mode": False,
+        "reload": False,
+    }
+    for key, value in ENV_DEFAULTS.items():
+        assert getattr(config, key) == value
+    assert ServerConfig.from_env(name="demo", description=DESCRIPTION) == config
+
+def test_from_env_converts_values(clean_env: pytest.MonkeyPatch):
+    """Test environment values are converted to field types."""
+    clean_env.setenv("MCP_HOST", "0.0.0.0")
+    clean_env.setenv("MCP_SERVER_PORT", "9000")
+    clean_env.setenv("MCP_LOG_LEVEL", "DEBUG")
+    clean_env.setenv("MCP_ENABLED_PLUGINS", "a,b")
+    clean_env.setenv("MCP_ALLOWED_ORIGINS", "http://x.com,http://y.com")
+    clean_env.setenv("MCP_DEV_MODE", "True")
+    clean_env.setenv("MCP_RELOAD", "no")
+
+    config = ServerConfig.from_env(name="demo", description=DESCRIPTION)
+
+    assert config.host == "0.0.0.0"
+    assert config.port == 9000
+    assert config.log_level is LogLevel.DEBUG
+    assert config.enabled_plugins == ["a", "b"]
+    assert config.allowed_origins == ["http://x.com", "http://y.com"]
+    assert config.dev_mode is True
+    assert config.reload is False
+
+def test_from_env_overrides_kwargs(clean_env: pytest.MonkeyPatch):
+    """Test environment variables take precedence over kwargs."""
+    clean_env.setenv("MCP_SERVER_PORT", "9000")
+    clean_env.setenv("MCP_HOST", "")
+
+    config = ServerConfig.from_env(
+        name="demo", description=DESCRIPTION, port=7000, host="localhost"
+    )
+
+    assert config.port == 9000
+    assert config.host == "localhost"  # Empty values are ignored
+
+def test_from_env_invalid_values(clean_env: pytest.MonkeyPatch):
+    """Test unparseable values are skipped and invalid ones rejected."""
+    clean_env.setenv("MCP_SERVER_PORT", "not-a-port")
+    config = ServerConfig.from_env(name="demo", description=DESCRIPTION)
+    assert config.port == 8000
+
+    clean_env.setenv("MCP_SERVER_PORT", "70000")
+    with pytest.raises(ValidationError):
+        ServerConfig.from_env(name="demo", description=DESCRIPTION)
+
+def test_field_defaults_read_env(clean_env: pytest.MonkeyPatch):
+    """Test the field defaults still read the environment directly."""
+    clean_env.setenv("MCP_SERVER_PORT", "9100")
+    clean_env.setenv("MCP_DEV_MODE", "true")
+
+    config = ServerConfig(name="demo", description=DESCRIPTION)
+
+    assert config.port == 9100
+    assert config.dev_mode is True
+
+# File round-trip tests
+def test_file_round_trip(tmp_path: Path, clean_env: pytest.MonkeyPatch):
+    """Test saving and loading preserves every field."""
+    resource = tmp_path / "data.txt"
+    resource.write_text("x")
+    config = ServerConfig(
+        name="demo",
+        description=DESCRIPTION,
+        port=9000,
+        log_level=LogLevel.WARNING,
+        plugin_dir=tmp_path,
+        plugin_config={"example": {"limit": 3, "tags": ["a"]}},
+        resource_paths=[resource],
+        api_keys={"client": "secret"},
+        dev_mode=True,
+    )
+    path = tmp_path / "config.json"
+
+    config.to_file(path)
+    loaded = ServerConfig.from_file(path)
+
+    assert loaded == config
+    assert isinstance(loaded.plugin_dir, Path)
+    assert loaded.log_level is LogLevel.WARNING
+
+def test_file_reload_after_save(tmp_path: Path, clean_env: pytest.MonkeyPatch):
+    """Test loading again after a save sees the new contents."""
+    path = tmp_path / "config.json"
+    config = ServerConfig(name="first", description=DESCRIPTION)
+    config.to_file(path)
+    assert ServerConfig.from_file(path).name == "first"
+
+    config.name = "other"
+    config.to_file(path)
+    assert ServerConfig.from_file(path).name == "other"
+
+def test_to_file_nested_path(tmp_path: Path, clean_env: pytest.MonkeyPatch):
+    """Test Paths nested in plugin_config are saved as strings."""
+    config = ServerConfig(
+        name="demo",
+        description=DESCRIPTION,
+        plugin_config={"example": {"root": tmp_path}}
+    )
+    path = tmp_path / "config.json"
+
+    config.to_file(path)
+
+    loaded = ServerConfig.from_file(path)
+    assert loaded.plugin_config == {"example": {"root": str(tmp_path)}}
+
+def test_to_file_rejects_unserializable(
+    tmp_path: Path,
+    clean_env: pytest.MonkeyPatch
+):
+    """Test values JSON cannot represent are not silently stringified."""
+    config = ServerConfig(
+        name="demo",
+        description=DESCRIPTION,
+        plugin_config={"tags": {"a", "b"}}
+    )
+    path = tmp_path / "config.json"
+
+    with pytest.raises(ConfigError):
+        config.to_file(path)
+    assert not path.exists()
+
+def test_from_file_errors(tmp_path: Path):
+    """Test unreadable, malformed and invalid files."""
+    with pytest.raises(ConfigError):
+        ServerConfig.from_file(tmp_path / "missing.json")
+
+    path = tmp_path / "bad.json"
+    path.write_text("{not json")
+    with pytest.raises(ConfigError):
+        ServerConfig.from_file(path)
+
+    path.write_text(
+        f'{{"name": "demo", "description": "{DESCRIPTION}", "port": 0}}'
+    )
+    with pytest.raises(ConfigError):
+        ServerConfig.from_file(path)
+
+# Validation tests
+def test_validate_rechecks_paths(tmp_path: Path, clean_env: pytest.MonkeyPatch):
+    """Test paths created or removed between calls are noticed."""
+    resource = tmp_path / "data.txt"
+    plugin = tmp_path / "extra.py"
+    config = ServerConfig(
+        name="demo",
+        description=DESCRIPTION,
+        plugin_dir=tmp_path,
+        enabled_plugins=["extra"],
+        resource_paths=[resource],
+    )
+    assert config.validate() == [
+        f"Resource path does not exist: {resource}",
+        f"Plugin file not found: {plugin}",
+    ]
+
+    resource.write_text("x")
+    plugin.write_text("")
+    assert config.validate() == []
+
+    resource.unlink()
+    assert config.validate() == [f"Resource path does not exist: {resource}"]
+
+def test_validate_dangling_symlinks(
+    tmp_path: Path,
+    clean_env: pytest.MonkeyPatch
+):
+    """Test symlinks to missing files count as missing."""
+    (tmp_path / "data.txt").symlink_to(tmp_path / "gone.txt")
+    (tmp_path / "extra.py").symlink_to(tmp_path / "gone.py")
+    (tmp_path / "real.txt").write_text("x")
+    (tmp_path / "linked.txt").symlink_to(tmp_path / "real.txt")
+    config = ServerConfig(
+        name="demo",
+        description=DESCRIPTION,
+        plugin_dir=tmp_path,
+        enabled_plugins=["extra"],
+        resource_paths=[tmp_path / "data.txt", tmp_path / "linked.txt"],
+    )
+
+    assert config.validate() == [
+        f"Resource path does not exist: {tmp_path / 'data.txt'}",
+        f"Plugin file not found: {tmp_path / 'extra.py'}",
+    ]
+
+def test_validate_field_changes(clean_env: pytest.MonkeyPatch):
+    """Test changed fields are validated again."""
+    config = ServerConfig(name="demo", description=DESCRIPTION)
+    assert config.validate() == []
+
+    config.port = 0
+    assert config.validate() == ["Port must be between 1 and 65535, got 0"]
+
+    config.port = 8000
+    assert config.validate() == []
@@ -0,0 +1,321 @@
+"""Tests for the server manager module.
+
+File: create_mcp_server/tests/server/test_manager.py
+
+This module contains tests for ServerManager, covering:
+- Starting and stopping the server as an asyncio subprocess
+- Probing the health endpoint
+- Scheduling health and status checks in one monitoring loop
+- Stopping on termination signals
+
+The server is a stand-in uv executable on PATH that serves GET /health
+with the standard library instead of running uvicorn.
+"""
+
+import asyncio
+import os
+import signal
+import socket
+import sys
+from pathlib import Path
+
+import pytest
+
+from create_mcp_server.server import manager as manager_module
+from create_mcp_server.server.config import ServerConfig
+from create_mcp_server.server.manager import (
+    READY_MARKER,
+    ServerManager,
+    ServerStartError,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="stand-in uv is a POSIX script"
+)
+
+# Stand-in for `uv run uvicorn ...`, configured through the same
+# environment variables ServerManager passes to the real server
+FAKE_SERVER = f"""#!{sys.executable}
+import os
+import sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200 if self.path == "/health" else 404)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+server = HTTPServer(
+    (os.environ["MCP_SERVER_HOST"], int(os.environ["MCP_SERVER_PORT"])),
+    Handler
+)
+with open("argv.txt", "w") as f:
+    f.write(" ".join(sys.argv[1:]))
+# More output than a pipe buffer holds, to block a server nobody reads
+sys.stdout.write(("x" * 1000 + "\\n") * 256)
+print("INFO:     {READY_MARKER}.", file=sys.stderr, flush=True)
+server.serve_forever()
+"""
+
+# Test fixtures
+@pytest.fixture
+def uv_bin(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Provide a directory searched for uv before the rest of PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return bin_dir
+
+@pytest.fixture
+def server_dir(tmp_path: Path) -> Path:
+    """Provide the directory the server runs in."""
+    directory = tmp_path / "server"
+    directory.mkdir()
+    return directory
+
+@pytest.fixture
+def config() -> ServerConfig:
+    """Provide a configuration with a free port and no monitoring."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return ServerConfig(
+        name="demo",
+        host="127.0.0.1",
+        port=port,
+        health_check_interval=0,
+        status_check_interval=0,
+    )
+
+def _probe(config: ServerConfig, response: bytes) -> list:
+    """Probe a server that answers with response, returning what it read."""
+    received = []
+
+    async def handle(reader, writer):
+        received.append(await reader.readuntil(b"\r\n\r\n"))
+        writer.write(response)
+        await writer.drain()
+        if response:
+            writer.close()
+
+    async def run():
+        server = await asyncio.start_server(handle, config.host, config.port)
+        async with server:
+            manager = ServerManager(Path("."), "demo", config)
+            manager._health_request = b"GET /health HTTP/1.1\r\n\r\n"
+            return await manager._probe_health()
+
+    return [asyncio.run(run()), *received]
+
+def _monitor(
+    config: ServerConfig,
+    healthy: bool = True,
+    wake_after: int = 0,
+    duration: float = 1.0
+) -> list:
+    """Run the monitoring loop, returning the checks it made in order.
+    
+    With wake_after, the loop is woken once that many checks have run and
+    stopped once it has made them all again.
+    """
+    checks = []
+    manager = ServerManager(Path("."), "demo", config)
+
+    async def check_health():
+        checks.append("health")
+        return healthy
+
+    async def check_status():
+        checks.append("status")
+
+    manager._check_health = check_health
+    manager._check_status = check_status
+
+    async def run():
+        manager._start_monitoring()
+        if wake_after:
+            while len(checks) < wake_after:
+                await asyncio.sleep(0.01)
+            manager._wake_monitors()
+            while len(checks) < 2 * wake_after:
+                await asyncio.sleep(0.01)
+        else:
+            await asyncio.sleep(duration)
+        await manager._stop_monitoring()
+
+    asyncio.run(asyncio.wait_for(run(), 5))
+    return checks
+
+def _install_uv(bin_dir: Path, script: str) -> None:
+    """Write a stand-in uv executable."""
+    uv = bin_dir / "uv"
+    uv.write_text(script)
+    uv.chmod(0o755)
+
+# Start and stop tests
+def test_start_and_stop(
+    uv_bin: Path,
+    server_dir: Path,
+    config: ServerConfig
+):
+    """Test the server starts, reports running, and stops."""
+    _install_uv(uv_bin, FAKE_SERVER)
+    manager = ServerManager(server_dir, "demo", config)
+
+    async def run():
+        await manager.start()
+        try:
+            status = await manager.get_status()
+            assert status.running
+            assert status.pid == manager.process.pid
+        finally:
+            process = manager.process
+            await manager.stop()
+        assert process.returncode is not None
+        assert not (await manager.get_status()).running
+
+    asyncio.run(run())
+
+    argv = (server_dir / "argv.txt").read_text()
+    assert argv == (
+        f"run uvicorn demo.server:app --host 127.0.0.1 "
+        f"--port {config.port} --log-level info"
+    )
+
+def test_start_reports_stderr(
+    uv_bin: Path,
+    server_dir: Path,
+    config: ServerConfig
+):
+    """Test a server that exits during startup reports its stderr."""
+    _install_uv(uv_bin, "#!/bin/sh\necho 'no module named demo' >&2\nexit 3\n")
+    manager = ServerManager(server_dir, "demo", config)
+
+    with pytest.raises(ServerStartError) as exc_info:
+        asyncio.run(manager.start())
+
+    assert "exit code 3" in str(exc_info.value)
+    assert "no module named demo" in str(exc_info.value)
+    assert manager.process is None
+
+# _probe_health tests
+def test_probe_health_status(config: ServerConfig):
+    """Test the status code is read from the response's status line."""
+    status, request = _probe(
+        config,
+        b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\n\r\n"
+    )
+
+    assert status == 503
+    assert request == b"GET /health HTTP/1.1\r\n\r\n"
+
+def test_probe_health_malformed(config: ServerConfig):
+    """Test a response without an HTTP status line is rejected."""
+    with pytest.raises(ValueError, match="Malformed status line"):
+        _probe(config, b"SSH-2.0-OpenSSH\r\n")
+
+def test_probe_health_timeout(
+    config: ServerConfig,
+    monkeypatch: pytest.MonkeyPatch
+):
+    """Test a server that never answers times out."""
+    monkeypatch.setattr(manager_module, "HEALTH_CHECK_TIMEOUT", 0.1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        _probe(config, b"")
+
+def test_probe_health_refused(config: ServerConfig):
+    """Test a port nobody listens on raises OSError."""
+    manager = ServerManager(Path("."), "demo", config)
+
+    with pytest.raises(OSError):
+        asyncio.run(manager._probe_health())
+
+# Monitoring loop tests
+def test_monitor_intervals(config: ServerConfig):
+    """Test each check runs on its own interval in the shared loop."""
+    config.health_check_interval = 0.05
+    config.status_check_interval = 100
+
+    checks = _monitor(config, duration=0.3)
+
+    assert checks[:2] == ["health", "status"]
+    assert checks.count("status") == 1
+    assert checks.count("health") >= 3
+
+def test_monitor_unhealthy_samples_status(config: ServerConfig):
+    """Test a failed health check samples status straight away."""
+    config.health_check_interval = 0.05
+    config.status_check_interval = 100
+
+    checks = _monitor(config, healthy=False, duration=0.2)
+
+    assert len(checks) >= 4
+    assert checks == ["health", "status"] * (len(checks) // 2)
+
+def test_monitor_wake(config: ServerConfig):
+    """Test waking the loop runs both checks without waiting."""
+    config.health_check_interval = 100
+    config.status_check_interval = 100
+
+    assert _monitor(config, wake_after=2) == ["health", "status"] * 2
+
+def test_monitor_single_check(config: ServerConfig):
+    """Test only configured checks run, and nothing when neither is."""
+    config.status_check_interval = 0.05
+
+    checks = _monitor(config, duration=0.2)
+
+    assert checks and set(checks) == {"status"}
+
+    config.status_check_interval = 0
+    manager = ServerManager(Path("."), "demo", config)
+    manager._start_monitoring()
+    assert manager._monitor_task is None
+
+# Signal handler tests
+def test_signal_stops_server(config: ServerConfig):
+    """Test SIGTERM stops the server from the event loop."""
+    manager = ServerManager(Path("."), "demo", config)
+    previous = signal.getsignal(signal.SIGTERM)
+
+    async def run():
+        manager._setup_signal_handlers()
+        os.kill(os.getpid(), signal.SIGTERM)
+        while manager._signal_stop_task is None:
+            await asyncio.sleep(0.01)
+        await manager._signal_stop_task
+
+    asyncio.run(asyncio.wait_for(run(), 5))
+
+    # stop() removed the handlers again
+    assert signal.getsignal(signal.SIGTERM) == previous
+
+def test_repeated_signals_stop_once(config: ServerConfig):
+    """Test a second signal during shutdown doesn't start another stop."""
+    manager = ServerManager(Path("."), "demo", config)
+    stops = []
+
+    async def stop():
+        stops.append(asyncio.current_task())
+        await asyncio.sleep(0.05)
+
+    manager.stop = stop
+
+    async def run():
+        manager._signal_handler(signal.SIGTERM)
+        first = manager._signal_stop_task
+        await asyncio.sleep(0)
+        manager._signal_handler(signal.SIGINT)
+        assert manager._signal_stop_task is first
+        await first
+        # Once finished, a new signal stops again
+        manager._signal_handler(signal.SIGTERM)
+        await manager._signal_stop_task
+
+    asyncio.run(run())
+
+    assert len(stops) == 2
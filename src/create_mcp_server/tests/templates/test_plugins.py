@@ -0,0 +1,233 @@
+"""Tests for the plugin system template.
+
+File: create_mcp_server/tests/templates/test_plugins.py
+
+This module contains tests for PluginManager discovery, covering:
+- Finding plugin classes without importing modules that define none
+- Inspecting plugin files concurrently
+- Caching discovery results per file modification time
+
+plugins.py is shipped next to the generated core module, so the tests
+render core.py into a package and import plugins.py from there.
+"""
+
+import asyncio
+import logging
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+from types import ModuleType
+from typing import Generator
+
+import pytest
+from jinja2 import Environment, FileSystemLoader
+
+from create_mcp_server.core.template import DEFAULT_TEMPLATE_DIR
+
+# Name of the generated package plugins.py is imported from
+PACKAGE = "plugin_host"
+
+# Test fixtures
+@pytest.fixture
+def plugins(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch
+) -> Generator[ModuleType, None, None]:
+    """Import plugins.py from a package with a rendered core module."""
+    package_dir = tmp_path / "src" / PACKAGE
+    package_dir.mkdir(parents=True)
+    (package_dir / "__init__.py").write_text("")
+    env = Environment(
+        loader=FileSystemLoader(str(DEFAULT_TEMPLATE_DIR)),
+        keep_trailing_newline=True
+    )
+    (package_dir / "core.py").write_text(
+        env.get_template("core.py.jinja2").render(server_name=PACKAGE)
+    )
+    shutil.copy(DEFAULT_TEMPLATE_DIR / "plugins" / "plugins.py", package_dir)
+    monkeypatch.syspath_prepend(str(tmp_path / "src"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    yield __import__(f"{PACKAGE}.plugins").plugins
+
+    for name in list(sys.modules):
+        if name == PACKAGE or name.startswith(f"{PACKAGE}."):
+            del sys.modules[name]
+
+@pytest.fixture
+def plugin_dir(tmp_path: Path) -> Path:
+    """Provide an empty plugin directory."""
+    directory = tmp_path / "plugins"
+    directory.mkdir()
+    return directory
+
+@pytest.fixture
+def imports(plugins: ModuleType) -> list:
+    """Record the plugin modules imported during discovery."""
+    sys.modules[PACKAGE].imports = []
+    return sys.modules[PACKAGE].imports
+
+def _write_plugin(plugin_dir: Path, name: str, body: str = "") -> Path:
+    """Write a plugin module defining <Name>Plugin on top of BasePlugin."""
+    path = plugin_dir / f"{name}.py"
+    path.write_text(
+        f"from {PACKAGE} import plugins\n"
+        f"{body}\n"
+        f"class {name.title()}Plugin(plugins.BasePlugin):\n"
+        f"    name = {name!r}\n"
+        f"    version = '1.0.0'\n"
+    )
+    return path
+
+def _counted(name: str) -> str:
+    """Module code that records its own import."""
+    return f"import {PACKAGE}\n{PACKAGE}.imports.append({name!r})"
+
+def _discover(plugins: ModuleType, plugin_dir: Path) -> list:
+    """Run discovery, returning (name, version, class) per plugin."""
+    manager = plugins.PluginManager(plugin_dir)
+    metadata = asyncio.run(manager.discover_plugins())
+    return sorted(
+        (item.name, item.version, item.plugin_class) for item in metadata
+    )
+
+# Candidate filtering tests
+def test_discover_plugin_classes(plugins: ModuleType, plugin_dir: Path):
+    """Test classes providing the plugin interface are found."""
+    _write_plugin(plugin_dir, "alpha")
+    (plugin_dir / "_private.py").write_text("raise RuntimeError")
+
+    assert _discover(plugins, plugin_dir) == [
+        ("alpha", "1.0.0", "AlphaPlugin")
+    ]
+
+def test_discover_skips_modules_without_plugins(
+    plugins: ModuleType,
+    plugin_dir: Path,
+    caplog: pytest.LogCaptureFixture
+):
+    """Test modules that define no *Plugin class are never imported."""
+    (plugin_dir / "helpers.py").write_text(
+        "raise RuntimeError('imported')\n"
+        "class Helper:\n"
+        "    pass\n"
+    )
+    (plugin_dir / "imports_only.py").write_text(
+        "raise RuntimeError('imported')\n"
+        f"from {PACKAGE}.plugins import BasePlugin as BorrowedPlugin\n"
+    )
+
+    with caplog.at_level(logging.ERROR):
+        assert _discover(plugins, plugin_dir) == []
+    assert not caplog.records
+
+def test_discover_ignores_non_plugins(plugins: ModuleType, plugin_dir: Path):
+    """Test a *Plugin class missing interface members is not a plugin."""
+    (plugin_dir / "fake.py").write_text(
+        "class FakePlugin:\n"
+        "    name = 'fake'\n"
+    )
+
+    assert _discover(plugins, plugin_dir) == []
+
+# Concurrent discovery tests
+def test_discover_files_concurrently(plugins: ModuleType, plugin_dir: Path):
+    """Test plugin modules are imported in parallel, off the event loop."""
+    # Each import waits for all the others; one at a time, they'd time out
+    names = ["alpha", "beta", "gamma"]
+    sys.modules[PACKAGE].barrier = threading.Barrier(len(names))
+    for name in names:
+        _write_plugin(
+            plugin_dir, name,
+            f"import {PACKAGE}\n{PACKAGE}.barrier.wait(timeout=5)"
+        )
+
+    assert [item[0] for item in _discover(plugins, plugin_dir)] == names
+
+def test_discover_isolates_failures(
+    plugins: ModuleType,
+    plugin_dir: Path,
+    caplog: pytest.LogCaptureFixture
+):
+    """Test a module that fails to import doesn't stop the others."""
+    _write_plugin(plugin_dir, "alpha")
+    _write_plugin(plugin_dir, "broken", "raise RuntimeError('boom')")
+
+    with caplog.at_level(logging.ERROR):
+        assert _discover(plugins, plugin_dir) == [
+            ("alpha", "1.0.0", "AlphaPlugin")
+        ]
+    assert "broken.py: boom" in caplog.text
+
+# Discovery cache tests
+def test_discover_cached(
+    plugins: ModuleType,
+    plugin_dir: Path,
+    imports: list,
+    tmp_path: Path
+):
+    """Test unchanged files are not imported again."""
+    _write_plugin(plugin_dir, "alpha", _counted("alpha"))
+    _write_plugin(plugin_dir, "beta", _counted("beta"))
+
+    first = _discover(plugins, plugin_dir)
+    second = _discover(plugins, plugin_dir)
+
+    assert first == second
+    assert sorted(imports) == ["alpha", "beta"]
+    # Cached in the user cache directory, not next to the plugins
+    cache_dir = tmp_path / "cache" / plugins.DISCOVERY_CACHE_DIR
+    assert len(list(cache_dir.iterdir())) == 1
+    assert sorted(p.name for p in plugin_dir.iterdir()) == ["alpha.py", "beta.py"]
+
+def test_discover_modified_file(
+    plugins: ModuleType,
+    plugin_dir: Path,
+    imports: list
+):
+    """Test a file with a new modification time is inspected again."""
+    path = _write_plugin(plugin_dir, "alpha", _counted("alpha"))
+    _discover(plugins, plugin_dir)
+
+    path.write_text(path.read_text().replace("1.0.0", "2.0.0"))
+    mtime_ns = path.stat().st_mtime_ns + 10**9
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    assert _discover(plugins, plugin_dir) == [
+        ("alpha", "2.0.0", "AlphaPlugin")
+    ]
+    assert imports == ["alpha", "alpha"]
+
+def test_discover_retries_failures(
+    plugins: ModuleType,
+    plugin_dir: Path,
+    imports: list
+):
+    """Test a file that failed to load is not cached."""
+    _write_plugin(plugin_dir, "alpha", _counted("alpha") + "\n1 / 0")
+
+    assert _discover(plugins, plugin_dir) == []
+    assert _discover(plugins, plugin_dir) == []
+    assert imports == ["alpha", "alpha"]
+
+def test_discover_corrupt_cache(
+    plugins: ModuleType,
+    plugin_dir: Path,
+    imports: list
+):
+    """Test an unreadable cache is ignored and rewritten."""
+    _write_plugin(plugin_dir, "alpha", _counted("alpha"))
+    manager = plugins.PluginManager(plugin_dir)
+    cache_path = manager._discovery_cache_path()
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text("{not json")
+
+    assert _discover(plugins, plugin_dir) == [
+        ("alpha", "1.0.0", "AlphaPlugin")
+    ]
+    assert _discover(plugins, plugin_dir) == [
+        ("alpha", "1.0.0", "AlphaPlugin")
+    ]
+    assert imports == ["alpha"]
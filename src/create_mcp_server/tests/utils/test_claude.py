@@ -0,0 +1,196 @@
+"""Tests for the Claude module.
+
+File: create_mcp_server/tests/utils/test_claude.py
+
+This module contains tests for the Claude Desktop config helpers, covering:
+- Reusing the parsed config while the file is unchanged
+- Checking registrations with the generated schema validator
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Generator
+from unittest.mock import patch
+
+import pytest
+
+from create_mcp_server.utils import claude
+from create_mcp_server.utils.claude import (
+    ServerRegistration,
+    _check_registrations,
+    load_claude_config,
+    save_claude_config,
+)
+
+# Test fixtures
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep parsed configs from leaking between tests."""
+    monkeypatch.setattr(claude, "_config_cache", {})
+
+@pytest.fixture
+def config_path(tmp_path: Path) -> Path:
+    """Provide a Claude config with one registration."""
+    path = tmp_path / "claude_desktop_config.json"
+    path.write_text(json.dumps({
+        "mcpServers": {
+            "demo": {
+                "name": "demo",
+                "command": "uv",
+                "args": ["run", "demo"],
+                "env": {},
+                "working_dir": str(tmp_path),
+            }
+        }
+    }))
+    return path
+
+@pytest.fixture
+def parses() -> Generator[list, None, None]:
+    """Record each time a config file is parsed."""
+    calls = []
+    loads = json.loads
+
+    def record(raw):
+        calls.append(raw)
+        return loads(raw)
+
+    with patch.object(claude, "orjson", None):
+        with patch.object(claude.json, "loads", record):
+            yield calls
+
+@pytest.fixture
+def schema_validator() -> None:
+    """Skip unless the generated validator is available."""
+    pytest.importorskip("fastjsonschema")
+
+def _registration(working_dir: Path, **overrides) -> dict:
+    """Build registration data, valid unless overridden."""
+    data = ServerRegistration(
+        name="demo",
+        command="uv",
+        args=["run", "demo"],
+        env={},
+        working_dir=working_dir,
+        health_check_url="http://localhost:8000/health",
+    ).to_dict()
+    data.update(overrides)
+    return data
+
+# load_claude_config cache tests
+def test_load_unchanged_reuses_parse(config_path: Path, parses: list):
+    """Test loading an unchanged file parses it only once."""
+    first = load_claude_config(config_path)
+    second = load_claude_config(config_path)
+
+    assert first == second
+    assert len(parses) == 1
+
+def test_load_returns_independent_copies(config_path: Path, parses: list):
+    """Test edits to a loaded config don't leak into later loads."""
+    first = load_claude_config(config_path)
+    first["mcpServers"]["demo"]["command"] = "python"
+    first["mcpServers"]["other"] = {}
+
+    second = load_claude_config(config_path)
+
+    assert second["mcpServers"]["demo"]["command"] == "uv"
+    assert "other" not in second["mcpServers"]
+
+def test_load_after_external_change(config_path: Path, parses: list):
+    """Test a file changed by another program is read again."""
+    load_claude_config(config_path)
+    config_path.write_text(json.dumps({"mcpServers": {}, "theme": "dark"}))
+
+    assert load_claude_config(config_path)["theme"] == "dark"
+    assert len(parses) == 2
+
+def test_load_after_save_skips_read(config_path: Path, parses: list):
+    """Test a config just saved is loaded without reading the file."""
+    config_data = load_claude_config(config_path)
+    config_data["mcpServers"]["demo"]["working_dir"] = config_path.parent
+    save_claude_config(config_path, config_data)
+
+    with patch.object(Path, "read_bytes", side_effect=AssertionError):
+        loaded = load_claude_config(config_path)
+
+    assert loaded["mcpServers"]["demo"]["working_dir"] == config_path.parent
+    assert len(parses) == 1
+
+def test_load_missing_file(config_path: Path, parses: list):
+    """Test a deleted file loads as an empty config."""
+    load_claude_config(config_path)
+    config_path.unlink()
+
+    assert load_claude_config(config_path) == {"mcpServers": {}}
+    assert config_path not in claude._config_cache
+
+# _check_registrations tests
+@pytest.mark.parametrize("overrides", [
+    {},
+    {"health_check_url": None},
+    {"health_check_url": "https://example.com/health?x=1"},
+    {"name": "Demo"},
+    {"name": "demo\n"},
+    {"name": "1demo"},
+    {"name": "-demo"},
+    {"name": "my demo"},
+    {"health_check_url": "ftp://example.com"},
+    {"health_check_url": "http://example.com/\n"},
+    {"health_check_url": "http://exa mple.com"},
+])
+def test_schema_matches_validate(
+    tmp_path: Path,
+    schema_validator: None,
+    overrides: dict
+):
+    """Test the schema accepts exactly what validate() accepts."""
+    data = _registration(tmp_path, **overrides)
+    registration = ServerRegistration.from_dict(dict(data))
+
+    try:
+        claude._VALIDATE_SERVERS({"demo": data})
+        schema_valid = True
+    except claude.fastjsonschema.JsonSchemaException:
+        schema_valid = False
+
+    assert schema_valid == (not registration.validate())
+
+def test_check_registrations_fast_path(
+    tmp_path: Path,
+    schema_validator: None,
+    caplog: pytest.LogCaptureFixture
+):
+    """Test valid registrations are checked without building objects."""
+    servers = {
+        "demo": _registration(tmp_path),
+        "gone": _registration(tmp_path / "missing", name="gone"),
+    }
+
+    with patch.object(ServerRegistration, "from_dict") as from_dict:
+        with caplog.at_level(logging.WARNING):
+            _check_registrations(servers)
+
+    from_dict.assert_not_called()
+    assert [r.getMessage() for r in caplog.records] == [
+        "Invalid server registration 'gone': "
+        f"['Working directory does not exist: {tmp_path / 'missing'}']"
+    ]
+
+def test_check_registrations_reports_invalid(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture
+):
+    """Test an invalid registration is reported with its errors."""
+    servers = {
+        "demo": _registration(tmp_path),
+        "bad": _registration(tmp_path, name="1bad"),
+    }
+
+    with caplog.at_level(logging.WARNING):
+        _check_registrations(servers)
+
+    assert len(caplog.records) == 1
+    assert "Invalid server registration 'bad'" in caplog.text
+    assert "Invalid server name" in caplog.text
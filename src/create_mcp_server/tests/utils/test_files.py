@@ -0,0 +1,320 @@
+"""Tests for the files module.
+
+File: create_mcp_server/tests/utils/test_files.py
+
+This module contains tests for the file system helpers, covering:
+- Atomic writes, with and without O_TMPFILE
+- Atomic replacement through a temporary path
+- Batched and concurrent atomic writes
+- Directory tree removal
+- Locking files for writing
+"""
+
+import os
+import stat
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from create_mcp_server.utils import files
+from create_mcp_server.utils.files import (
+    AtomicWriteError,
+    FileError,
+    LockError,
+    atomic_replace,
+    atomic_write,
+    atomic_write_batch,
+    atomic_write_many,
+    atomic_write_stream,
+    file_lock,
+    safe_rmtree,
+)
+
+# Test fixtures
+@pytest.fixture
+def no_proc(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Simulate a system where /proc is not mounted."""
+    monkeypatch.setattr(files, "_PROC_FD_DIR", "/nonexistent/proc/self/fd")
+    monkeypatch.setattr(files, "_anonymous_temp_linkable", True)
+
+def _leftovers(directory: Path) -> list:
+    """List temporary files left behind in a directory."""
+    return [p.name for p in directory.iterdir() if p.name.endswith(".tmp")]
+
+# atomic_write tests
+def test_atomic_write_new_file(tmp_path: Path):
+    """Test writing a new file, creating missing parents."""
+    target = tmp_path / "sub" / "out.txt"
+    atomic_write(target, "hello")
+
+    assert target.read_text() == "hello"
+    assert stat.S_IMODE(target.stat().st_mode) == 0o644
+    assert not _leftovers(target.parent)
+
+def test_atomic_write_replaces_existing(tmp_path: Path):
+    """Test replacing an existing file with bytes content."""
+    target = tmp_path / "out.bin"
+    target.write_bytes(b"old")
+    atomic_write(target, b"new", fsync=True)
+
+    assert target.read_bytes() == b"new"
+    assert not _leftovers(tmp_path)
+
+def test_atomic_write_preserve_mode(tmp_path: Path):
+    """Test keeping the permissions of the file being replaced."""
+    target = tmp_path / "script.sh"
+    target.write_text("old")
+    target.chmod(0o755)
+
+    atomic_write(target, "new", preserve_mode=True)
+    assert stat.S_IMODE(target.stat().st_mode) == 0o755
+
+    atomic_write(target, "newer")
+    assert stat.S_IMODE(target.stat().st_mode) == 0o644
+
+def test_atomic_write_large_content(tmp_path: Path):
+    """Test content larger than the stream buffer."""
+    target = tmp_path / "large.bin"
+    content = os.urandom(files.WRITE_BUFFER_SIZE + 12345)
+    atomic_write(target, content)
+    assert target.read_bytes() == content
+
+def test_atomic_write_without_proc(tmp_path: Path, no_proc: None):
+    """Test falling back to mkstemp when O_TMPFILE cannot be linked."""
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+
+    atomic_write(first, "one", fsync=True)
+    atomic_write(second, "two")
+
+    assert first.read_text() == "one"
+    assert second.read_text() == "two"
+    assert stat.S_IMODE(first.stat().st_mode) == 0o644
+    assert not _leftovers(tmp_path)
+
+def test_atomic_write_failure_keeps_target(tmp_path: Path):
+    """Test that a failed replace leaves the old content in place."""
+    target = tmp_path / "out.txt"
+    target.write_text("old")
+
+    with patch("os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(AtomicWriteError):
+            atomic_write(target, "new")
+
+    assert target.read_text() == "old"
+    assert not _leftovers(tmp_path)
+
+def test_atomic_write_stream_error_in_block(tmp_path: Path):
+    """Test that an error inside the block propagates and writes nothing."""
+    target = tmp_path / "out.txt"
+    target.write_text("old")
+
+    with pytest.raises(KeyError):
+        with atomic_write_stream(target) as f:
+            f.write(b"partial")
+            raise KeyError("boom")
+
+    assert target.read_text() == "old"
+    assert not _leftovers(tmp_path)
+
+# Batched writes
+def test_atomic_write_batch(tmp_path: Path):
+    """Test writing several files, recording each one written."""
+    existing = tmp_path / "a.txt"
+    existing.write_text("old")
+    items = [(existing, "A"), (tmp_path / "b" / "b.txt", b"B")]
+    written = set()
+
+    atomic_write_batch(items, fsync=True, written=written)
+
+    assert existing.read_text() == "A"
+    assert (tmp_path / "b" / "b.txt").read_text() == "B"
+    assert written == {path for path, _ in items}
+
+def test_atomic_write_batch_partial_failure(tmp_path: Path):
+    """Test that files already in place are reported after a failure."""
+    first = tmp_path / "new.txt"
+    second = tmp_path / "existing.txt"
+    second.write_text("old")
+    written = set()
+
+    # The new file is linked from O_TMPFILE or renamed before the
+    # existing one, whose rename fails
+    real_replace = os.replace
+    def failing_replace(src, dst, *args, **kwargs):
+        if os.fspath(dst) == str(second):
+            raise OSError("disk full")
+        return real_replace(src, dst, *args, **kwargs)
+
+    with patch("os.replace", side_effect=failing_replace):
+        with pytest.raises(AtomicWriteError):
+            atomic_write_batch([(first, "1"), (second, "2")], written=written)
+
+    assert written == {first}
+    assert second.read_text() == "old"
+    assert not _leftovers(tmp_path)
+
+def test_atomic_write_many(tmp_path: Path):
+    """Test concurrent writes of independent files."""
+    items = [(tmp_path / f"{i}.txt", str(i)) for i in range(10)]
+    atomic_write_many(items, fsync=True)
+
+    for path, content in items:
+        assert path.read_text() == content
+
+def test_atomic_write_many_fsyncs_copies(tmp_path: Path, no_proc: None):
+    """Test files copied out of O_TMPFILE are fsynced before the rename."""
+    copies = []
+    replace_from_fd = files._replace_from_fd
+
+    def record(fd, directory, name, fsync):
+        copies.append((name, fsync))
+        replace_from_fd(fd, directory, name, fsync)
+
+    with patch.object(files, "_replace_from_fd", record):
+        atomic_write_many([(tmp_path / "out.txt", "data")], fsync=True)
+
+    assert copies == [("out.txt", True)]
+    assert (tmp_path / "out.txt").read_text() == "data"
+
+# atomic_replace tests
+def test_atomic_replace_writes_target(tmp_path: Path):
+    """Test that a file written in the block replaces the target."""
+    target = tmp_path / "out.txt"
+    target.write_text("old")
+
+    with atomic_replace(target) as tmp:
+        assert tmp.parent == tmp_path
+        tmp.write_text("new")
+
+    assert target.read_text() == "new"
+    assert not _leftovers(tmp_path)
+
+def test_atomic_replace_no_write(tmp_path: Path):
+    """Test that a block that writes nothing leaves the target untouched."""
+    target = tmp_path / "out.txt"
+    target.write_text("old")
+
+    with atomic_replace(target):
+        pass
+
+    assert target.read_text() == "old"
+    assert not _leftovers(tmp_path)
+
+def test_atomic_replace_error(tmp_path: Path):
+    """Test that an error in the block discards the temporary file."""
+    target = tmp_path / "out.txt"
+    target.write_text("old")
+
+    with pytest.raises(RuntimeError):
+        with atomic_replace(target) as tmp:
+            tmp.write_text("new")
+            raise RuntimeError("boom")
+
+    assert target.read_text() == "old"
+    assert not _leftovers(tmp_path)
+
+# safe_rmtree tests
+def test_safe_rmtree_removes_tree(tmp_path: Path):
+    """Test removing nested directories, files and read-only files."""
+    root = tmp_path / "tree"
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "a" / "b" / "file.txt").write_text("x")
+    read_only = root / "a" / "ro.txt"
+    read_only.write_text("x")
+    read_only.chmod(0o444)
+
+    safe_rmtree(root)
+    assert not root.exists()
+
+def test_safe_rmtree_missing(tmp_path: Path):
+    """Test that a missing directory is ignored."""
+    safe_rmtree(tmp_path / "missing")
+
+def test_safe_rmtree_symlink_root(tmp_path: Path):
+    """Test that a symlink to a directory is refused, not followed."""
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "keep.txt").write_text("x")
+    link = tmp_path / "link"
+    link.symlink_to(target, target_is_directory=True)
+
+    with pytest.raises(FileError):
+        safe_rmtree(link)
+    safe_rmtree(link, ignore_errors=True)
+
+    assert (target / "keep.txt").exists()
+    assert link.is_symlink()
+
+def test_safe_rmtree_nested_symlink(tmp_path: Path):
+    """Test that symlinks inside the tree are removed without following."""
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "keep.txt").write_text("x")
+    root = tmp_path / "tree"
+    root.mkdir()
+    (root / "link").symlink_to(outside, target_is_directory=True)
+
+    safe_rmtree(root)
+
+    assert not root.exists()
+    assert (outside / "keep.txt").exists()
+
+# file_lock tests
+def test_file_lock_independent_files(tmp_path: Path):
+    """Test locks on different files in one directory don't contend."""
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    first.write_text("1")
+    second.write_text("2")
+
+    with file_lock(first):
+        with file_lock(second):
+            pass
+        # A new file locks the directory, which no existing file holds
+        with file_lock(tmp_path / "new.txt"):
+            pass
+        atomic_write(second, "two", lock=True)
+
+    assert second.read_text() == "two"
+
+def test_file_lock_same_file(tmp_path: Path):
+    """Test a second lock on a locked file fails at once."""
+    target = tmp_path / "out.txt"
+    target.write_text("old")
+
+    with file_lock(target):
+        with pytest.raises(LockError):
+            with file_lock(target):
+                pass
+        with pytest.raises(AtomicWriteError, match="locked"):
+            atomic_write(target, "new", lock=True)
+
+    assert target.read_text() == "old"
+
+def test_file_lock_new_files_wait(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch
+):
+    """Test new files share the directory lock for at most LOCK_TIMEOUT."""
+    monkeypatch.setattr(files, "LOCK_TIMEOUT", 0.02)
+
+    with file_lock(tmp_path / "a.txt"):
+        with pytest.raises(LockError):
+            with file_lock(tmp_path / "b.txt"):
+                pass
+
+    with file_lock(tmp_path / "b.txt"):
+        pass
+
+def test_file_lock_follows_replacement(tmp_path: Path):
+    """Test the lock is taken on the file the path names now."""
+    target = tmp_path / "out.txt"
+    target.write_text("old")
+
+    with file_lock(target):
+        atomic_write(target, "new")
+        # The lock is on the replaced inode, so the new file is free
+        with file_lock(target):
+            pass
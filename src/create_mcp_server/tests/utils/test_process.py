@@ -0,0 +1,237 @@
+"""Tests for the process module.
+
+File: create_mcp_server/tests/utils/test_process.py
+
+This module contains tests for the UV helpers, covering:
+- Locating UV and caching its version
+- Running UV commands, merging them where possible
+- Cleaning up the process groups of spawned commands
+- Probing the UV version
+- Command error messages
+"""
+
+import os
+import pickle
+import shutil
+import signal
+import subprocess
+import time
+from pathlib import Path
+from typing import Generator
+from unittest.mock import patch
+
+import pytest
+from packaging.version import Version
+
+from create_mcp_server.utils import process
+from create_mcp_server.utils.process import (
+    CommandError,
+    TimeoutError,
+    UVNotFoundError,
+    _merge_prefix,
+    _probe_uv_version,
+    check_uv_version,
+    clear_uv_cache,
+    process_cleanup,
+    run_uv_command,
+    run_uv_commands_batched,
+)
+
+# Resolved before the tests narrow PATH down to the fake uv
+SLEEP = shutil.which("sleep")
+
+# Test fixtures
+@pytest.fixture
+def uv_dir(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch
+) -> Generator[Path, None, None]:
+    """Provide an empty directory that is the only entry on PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", str(bin_dir))
+    clear_uv_cache()
+    yield bin_dir
+    clear_uv_cache()
+
+def _stopped(pid: int, timeout: float = 5) -> bool:
+    """Wait for a process to exit, counting an unreaped zombie as exited."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                state = f.read().rsplit(")", 1)[1].split()[0]
+        except FileNotFoundError:
+            return True
+        if state in ("Z", "X"):
+            return True
+        time.sleep(0.01)
+    return False
+
+def _install_uv(bin_dir: Path, script: str = 'echo "uv 0.4.18"') -> Path:
+    """Write a fake uv executable running a shell script."""
+    uv = bin_dir / "uv"
+    uv.write_text(f"#!/bin/sh\n{script}\n")
+    uv.chmod(0o755)
+    return uv
+
+# check_uv_version tests
+def test_check_uv_version(uv_dir: Path):
+    """Test reading and caching the version of the uv on PATH."""
+    uv = _install_uv(uv_dir)
+
+    assert check_uv_version() == Version("0.4.18")
+
+    # Cached: the probe doesn't run again
+    uv.unlink()
+    assert check_uv_version() == Version("0.4.18")
+
+def test_check_uv_version_installed_later(uv_dir: Path):
+    """Test that a missing uv is found once it is installed."""
+    with pytest.raises(UVNotFoundError):
+        check_uv_version()
+
+    _install_uv(uv_dir)
+    assert check_uv_version() == Version("0.4.18")
+
+# process_cleanup tests
+def test_process_cleanup_signals_listed_groups():
+    """Test only the listed groups are signalled, skipping vanished ones."""
+    signalled = []
+
+    def killpg(pgid: int, sig: int) -> None:
+        signalled.append((pgid, sig))
+        if pgid == 222:
+            raise ProcessLookupError(pgid)
+
+    with patch.object(process.os, "killpg", side_effect=killpg):
+        with process_cleanup([111]) as pgids:
+            pgids.extend([222, 333])
+
+    assert signalled == [
+        (111, signal.SIGTERM),
+        (222, signal.SIGTERM),
+        (333, signal.SIGTERM),
+    ]
+
+def test_process_cleanup_nothing_listed():
+    """Test nothing is signalled, least of all our own group, by default."""
+    with patch.object(process.os, "killpg") as killpg:
+        with process_cleanup():
+            pass
+
+    killpg.assert_not_called()
+
+@pytest.mark.skipif(not os.path.isdir("/proc"), reason="needs /proc")
+def test_run_uv_command_stops_leftovers(uv_dir: Path, tmp_path: Path):
+    """Test processes a command leaves running in its group are stopped."""
+    pid_file = tmp_path / "pid"
+    _install_uv(uv_dir, f"{SLEEP} 30 >/dev/null 2>&1 &\necho $! > {pid_file}")
+
+    run_uv_command(["sync"], cwd=tmp_path)
+
+    assert _stopped(int(pid_file.read_text()))
+
+# run_uv_command tests
+def test_run_uv_command_timeout_group_gone(uv_dir: Path, tmp_path: Path):
+    """Test a timed-out command is killed even if its group has vanished."""
+    _install_uv(uv_dir, f"exec {SLEEP} 30")
+
+    def group_gone(pgid: int, sig: int) -> None:
+        raise ProcessLookupError(pgid)
+
+    with patch.object(process.os, "killpg", side_effect=group_gone):
+        with pytest.raises(TimeoutError, match="timed out"):
+            run_uv_command(["sync"], cwd=tmp_path, timeout=0.2)
+
+@pytest.mark.parametrize("args, prefix", [
+    (["pip", "install", "a", "b"], ("pip", "install")),
+    (["pip", "uninstall", "a"], ("pip", "uninstall")),
+    (["add", "a"], ("add",)),
+    (["pip", "install"], None),
+    (["pip", "install", "-e", "."], None),
+    (["add", "a", "--dev"], None),
+    (["sync"], None),
+])
+def test_merge_prefix(args: list, prefix: tuple):
+    """Test only option-free mergeable commands have a prefix."""
+    assert _merge_prefix(args) == prefix
+
+def test_run_uv_commands_batched(uv_dir: Path, tmp_path: Path):
+    """Test consecutive mergeable commands run as one invocation."""
+    _install_uv(uv_dir, 'echo "$@"')
+
+    results = run_uv_commands_batched(
+        [
+            ["pip", "install", "a"],
+            ["pip", "install", "b"],
+            ["add", "c"],
+            ["pip", "install", "-e", "."],
+            ["pip", "install", "d"],
+        ],
+        cwd=tmp_path
+    )
+
+    assert [r.stdout for r in results] == [
+        "pip install a b\n",
+        "add c\n",
+        "pip install -e .\n",
+        "pip install d\n",
+    ]
+
+# _probe_uv_version tests
+def test_probe_uv_version(uv_dir: Path):
+    """Test the probe returns stdout and discards stderr."""
+    uv = _install_uv(uv_dir, 'echo "uv 0.4.18"; echo noise >&2')
+
+    assert _probe_uv_version(str(uv)) == "uv 0.4.18\n"
+
+def test_probe_uv_version_failure(uv_dir: Path):
+    """Test a failing uv raises CalledProcessError with its exit code."""
+    uv = _install_uv(uv_dir, "exit 3")
+
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        _probe_uv_version(str(uv))
+    assert exc_info.value.returncode == 3
+
+def test_probe_uv_version_timeout(uv_dir: Path):
+    """Test a hanging uv is killed once the timeout passes."""
+    uv = _install_uv(uv_dir, f"exec {SLEEP} 30")
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        _probe_uv_version(str(uv), timeout=0.2)
+
+def test_probe_uv_version_missing(tmp_path: Path):
+    """Test a missing executable raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        _probe_uv_version(str(tmp_path / "uv"))
+
+# CommandError tests
+def test_command_error_message():
+    """Test the message quotes the command and includes its output."""
+    error = CommandError(["uv", "add", "my pkg"], 2, "out", "err")
+
+    assert str(error) == (
+        "Command \"uv add 'my pkg'\" failed with exit code 2"
+        "\nOutput: out\nError: err"
+    )
+    assert str(CommandError(["uv"], 1, "", "")) == (
+        "Command 'uv' failed with exit code 1"
+    )
+
+def test_command_error_formats_lazily():
+    """Test the message is only built when the error is printed."""
+    with patch.object(process.shlex, "join", return_value="uv") as join:
+        error = CommandError(["uv"], 1, "", "")
+        join.assert_not_called()
+        str(error)
+    join.assert_called_once_with(["uv"])
+
+def test_command_error_pickles():
+    """Test the error keeps its details across pickling."""
+    error = pickle.loads(pickle.dumps(CommandError(["uv", "sync"], 1, "o", "e")))
+
+    assert (error.cmd, error.returncode, error.stdout, error.stderr) == (
+        ["uv", "sync"], 1, "o", "e"
+    )
+    assert "exit code 1" in str(error)
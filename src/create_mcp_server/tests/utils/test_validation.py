@@ -0,0 +1,221 @@
+"""Tests for the validation module.
+
+File: create_mcp_server/tests/utils/test_validation.py
+
+This module checks the validators against the results the original,
+unoptimized implementations gave, covering:
+- Package names, singly and in bulk
+- Version strings
+- Project paths
+- Descriptions
+- URLs and email addresses, with re and RE2
+- The Claude config schema patterns built from the shared ones
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from create_mcp_server.utils.claude import MCP_SERVERS_SCHEMA
+from create_mcp_server.utils.validation import (
+    URL_PATTERN,
+    check_package_name,
+    check_package_names,
+    check_project_path,
+    check_version,
+    validate_description,
+    validate_email,
+    validate_url,
+)
+
+# Package name tests
+@pytest.mark.parametrize("name,message", [
+    ("", "Package name cannot be empty"),
+    ("a", "Package name must be at least 2 characters"),
+    ("a" * 101, "Package name must be under 100 characters"),
+    ("my package", "Package name must not contain spaces"),
+    ("pkgé", "Package name must contain only ASCII characters"),
+    ("my$pkg", "Package name must contain only letters, digits, underscore, "
+               "hyphen, and period"),
+    ("ab\n", "Package name must contain only letters, digits, underscore, "
+             "hyphen, and period"),
+    ("_pkg", "Package name must not start or end with underscore, hyphen, "
+             "or period"),
+    ("pkg-", "Package name must not start or end with underscore, hyphen, "
+             "or period"),
+    ("my.pkg", "Package name must be a valid Python identifier when hyphens "
+               "are converted to underscores"),
+    ("1pkg", "Package name must be a valid Python identifier when hyphens "
+             "are converted to underscores"),
+])
+def test_check_package_name_invalid(name: str, message: str):
+    """Test the first failing rule is reported, as before."""
+    result = check_package_name(name)
+    assert not result.is_valid
+    assert result.message == message
+
+@pytest.mark.parametrize("name", [
+    "ab", "my-pkg", "my_pkg", "pkg2", "a" * 100, "MyPkg", "a--b",
+])
+def test_check_package_name_valid(name: str):
+    """Test accepted names, including non-lowercase ones."""
+    assert check_package_name(name).is_valid
+
+def test_check_package_names_matches_single():
+    """Test the bulk check agrees with check_package_name."""
+    names = ["ab", "my.pkg", "", "_pkg", "MyPkg", "pkgé", "a" * 101]
+    assert check_package_names(names) == [
+        check_package_name(name) for name in names
+    ]
+
+# Version tests
+@pytest.mark.parametrize("version,parsed", [
+    ("1.0.0", "1.0.0"),
+    ("1", "1"),
+    ("2.1.0.dev1", "2.1.0.dev1"),
+    ("1.0b2", "1.0b2"),
+    ("1.0.0rc1", "1.0.0rc1"),
+    ("1.0.0.post1", "1.0.0.post1"),
+    ("v1.0", "1.0"),
+    ("01.0", "1.0"),
+    ("1.0+local", "1.0+local"),
+])
+def test_check_version_valid(version: str, parsed: str):
+    """Test valid versions report their normalized form."""
+    result = check_version(version)
+    assert result.is_valid
+    assert result.details["parsed_version"] == parsed
+
+@pytest.mark.parametrize("version", ["", "abc", "1.0.0-beta.1.x", "1..0"])
+def test_check_version_invalid(version: str):
+    """Test invalid versions are rejected."""
+    result = check_version(version)
+    assert not result.is_valid
+    assert version in result.message
+
+# Project path tests
+def test_check_project_path(tmp_path: Path):
+    """Test each project path rule."""
+    (tmp_path / "file").write_text("x")
+    (tmp_path / "full").mkdir()
+    (tmp_path / "full" / "x").write_text("x")
+    (tmp_path / "empty").mkdir()
+
+    assert check_project_path(tmp_path / "new").is_valid
+    assert check_project_path(tmp_path / "empty").is_valid
+
+    result = check_project_path(tmp_path / "file")
+    assert result.message.startswith("Path exists and is not a directory")
+    result = check_project_path(tmp_path / "full")
+    assert result.message.startswith("Directory is not empty")
+    result = check_project_path(tmp_path / "missing" / "project")
+    assert result.message.startswith("Parent directory does not exist")
+    for name in ("con", "CON", "lpt1"):
+        result = check_project_path(tmp_path / name)
+        assert result.message == f"'{name}' is a reserved name"
+
+# Description tests
+@pytest.mark.parametrize("description,message", [
+    ("", "Description cannot be empty"),
+    ("x" * 501, "Description must be under 500 characters"),
+    ("short", "Description should be at least 10 characters"),
+    ("Tab\tseparated words here",
+     "Description must not contain control characters"),
+    ("日本語の説明文です とても 良い",
+     "Description contains too many non-printable characters"),
+    ("two wordsonly", "Description should contain at least 3 words"),
+])
+def test_validate_description_invalid(description: str, message: str):
+    """Test the first failing rule is reported, as before."""
+    result = validate_description(description)
+    assert not result.is_valid
+    assert result.message == message
+
+@pytest.mark.parametrize("description", [
+    "A fine description here",
+    "Ünicode is mostly plain ascii text here",
+    "A good description\x7f here",
+])
+def test_validate_description_valid(description: str):
+    """Test accepted descriptions, including a few non-printables."""
+    assert validate_description(description).is_valid
+
+# URL tests
+@pytest.mark.parametrize("url,valid", [
+    ("http://example.com", True),
+    ("https://a.b.co/path?q=1", True),
+    ("HTTP://EXAMPLE.COM", True),
+    ("http://localhost:8000", True),
+    ("http://1.2.3.4/health", True),
+    ("", False),
+    ("ftp://example.com", False),
+    ("httpx://example.com", False),
+    ("http://example", False),
+    ("http://example.com/a b", False),
+    ("http://" + "a" * 2000 + ".com", False),
+    # Deliberately stricter than the original, which matched with $
+    ("http://example.com\n", False),
+])
+def test_validate_url(url: str, valid: bool):
+    """Test URLs against the original results."""
+    assert validate_url(url).is_valid is valid
+
+@pytest.mark.parametrize("engine", ["re", "re2"])
+@pytest.mark.parametrize("url,valid", [
+    ("http://example.com/a?b=c", True),
+    ("HTTPS://Sub.Example.COM", True),
+    ("http://LocalHost", True),
+    ("http://example.com/caf\u00e9", True),
+    # Non-ASCII letters that fold to ASCII ones under Unicode case folding
+    ("http://\u212aelvin.com", False),
+    ("http://exam\u017fple.com", False),
+    ("http://\u0130nternet.com", False),
+    # Whitespace RE2's \s leaves out
+    ("http://example.com/a\vb", False),
+])
+def test_url_pattern_engines(engine: str, url: str, valid: bool):
+    """Test re and RE2 accept the same URLs with URL_PATTERN."""
+    module = pytest.importorskip(engine)
+    assert bool(module.compile(URL_PATTERN).fullmatch(url)) is valid
+    assert validate_url(url).is_valid is valid
+
+# Email tests
+@pytest.mark.parametrize("email,valid", [
+    ("a@b.com", True),
+    ("a.b@c.org", True),
+    ("a_b@c.com", True),
+    ("user@sub.domain.co", True),
+    ("", False),
+    ("a@b", False),
+    ("a@b.c", False),
+    ("a b@c.com", False),
+    ("x" * 250 + "@b.com", False),
+    # Deliberately stricter than the original prefix match
+    ("a@b.com junk", False),
+    ("a@b.com.", False),
+])
+def test_validate_email(email: str, valid: bool):
+    """Test email addresses against the original results."""
+    assert validate_email(email).is_valid is valid
+
+# Schema patterns
+@pytest.mark.parametrize("name", [
+    "ab", "my-pkg", "MyPkg", "a" * 100,
+    "a", "a" * 101, "my.pkg", "1pkg", "_pkg", "pkg-", "pkgé", "ab\n",
+])
+def test_schema_name_pattern_matches_check(name: str):
+    """Test the schema accepts exactly the names check_package_name does."""
+    properties = MCP_SERVERS_SCHEMA["additionalProperties"]["properties"]
+    pattern = properties["name"]["pattern"]
+    assert bool(re.search(pattern, name)) is check_package_name(name).is_valid
+
+@pytest.mark.parametrize("url", [
+    "http://example.com", "HTTP://LOCALHOST:80/a", "http://1.2.3.4",
+    "ftp://example.com", "http://example.com\n", "http://example",
+])
+def test_schema_url_pattern_matches_check(url: str):
+    """Test the schema accepts exactly the URLs validate_url does."""
+    properties = MCP_SERVERS_SCHEMA["additionalProperties"]["properties"]
+    pattern = properties["health_check_url"]["pattern"]
+    assert bool(re.search(pattern, url)) is validate_url(url).is_valid
@@ -12,24 +12,99 @@ registering MCP servers with Claude Desktop. It provides:
 File: create_mcp_server/utils/claude.py
 """
 
+import functools
 import json
 import logging
 import os
-import platform
 import sys
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from .files import atomic_write, atomic_replace, FileError
+from .files import atomic_write, FileError
 from .validation import (
+    URL_PATTERN,
+    VALID_PACKAGE_NAME_PATTERN,
     ValidationResult,
     check_package_name,
     validate_url
 )
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# perf-budget: Claude config handling is bound by syscall latency. Per
+# call:
+#   get_claude_config_path  one stat on the first call, none afterwards
+#   load_claude_config      one stat while the file is unchanged; open,
+#                           read and close in addition after it changes
+#   save_claude_config      atomic_write(fsync=True) plus one stat to
+#                           refresh the load cache
+
+# JSON Schema for the mcpServers section, equivalent to the name and URL
+# checks in ServerRegistration.validate(). The patterns are the ones
+# check_package_name and URL_REGEX use, anchored with \A and \Z because
+# $ would also match before a trailing newline. Both are written in ASCII
+# classes, so they need no flags.
+MCP_SERVERS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "additionalProperties": {
+        "type": "object",
+        "required": ["name", "command", "args", "env", "working_dir"],
+        "additionalProperties": False,
+        "properties": {
+            "name": {
+                "type": "string",
+                "pattern": rf"\A{VALID_PACKAGE_NAME_PATTERN}\Z",
+            },
+            "command": {"type": "string"},
+            "args": {"type": "array", "items": {"type": "string"}},
+            "env": {
+                "type": "object",
+                "additionalProperties": {"type": "string"},
+            },
+            "working_dir": {"type": "string"},
+            "enabled": {"type": "boolean"},
+            "health_check_url": {
+                "type": ["string", "null"],
+                "maxLength": 2000,
+                "pattern": rf"\A{URL_PATTERN}\Z",
+            },
+            "description": {"type": ["string", "null"]},
+        },
+    },
+}
+
+# Validator generated from MCP_SERVERS_SCHEMA when fastjsonschema is installed
+_VALIDATE_SERVERS = (
+    fastjsonschema.compile(MCP_SERVERS_SCHEMA)
+    if fastjsonschema is not None else None
+)
+
+# Claude Desktop config directory for each supported sys.platform
+_CONFIG_DIRS: Dict[str, Callable[[], Optional[Path]]] = {
+    "win32": lambda: (
+        Path(os.environ["APPDATA"], "Claude")
+        if os.environ.get("APPDATA") else None
+    ),
+    "darwin": lambda: Path.home() / "Library" / "Application Support" / "Claude",
+    "linux": lambda: Path.home() / ".config" / "claude",
+}
+
+# Parsed Claude configs by path, with the (st_mtime_ns, st_size) they
+# were read at, so repeated loads in one session skip the parse while
+# the file is unchanged
+_config_cache: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+
 class ClaudeError(Exception):
     """Base exception for Claude.app operations."""
     pass
@@ -42,7 +117,7 @@ class ValidationError(ClaudeError):
     """Raised when validation fails."""
     pass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ServerRegistration:
     """MCP server registration details."""
     name: str
@@ -85,9 +160,17 @@ class ServerRegistration:
         Returns:
             Dictionary representation for JSON serialization
         """
-        data = asdict(self)
-        data['working_dir'] = str(self.working_dir)
-        return data
+        # Built by hand: asdict() deep-copies every field via fields()
+        return {
+            'name': self.name,
+            'command': self.command,
+            'args': list(self.args),
+            'env': dict(self.env),
+            'working_dir': str(self.working_dir),
+            'enabled': self.enabled,
+            'health_check_url': self.health_check_url,
+            'description': self.description,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ServerRegistration':
@@ -111,6 +194,7 @@ class ServerRegistration:
         except Exception as e:
             raise ValidationError(f"Invalid registration data: {e}")
 
+@functools.lru_cache(maxsize=1)
 def get_claude_config_path() -> Optional[Path]:
     """Get the platform-specific Claude config directory path.
     
@@ -121,23 +205,20 @@ def get_claude_config_path() -> Optional[Path]:
     - Windows: %APPDATA%/Claude
     - macOS: ~/Library/Application Support/Claude
     - Linux: ~/.config/claude
-    """
-    system = platform.system().lower()
     
-    if system == "windows":
-        base = os.environ.get("APPDATA")
-        if not base:
-            return None
-        path = Path(base) / "Claude"
-    elif system == "darwin":
-        path = Path.home() / "Library" / "Application Support" / "Claude"
-    elif system == "linux":
-        path = Path.home() / ".config" / "claude"
-    else:
-        logger.debug(f"Claude Desktop is not supported on {system}")
+    The result is cached for the life of the process; call
+    get_claude_config_path.cache_clear() to resolve it again.
+    """
+    config_dir = _CONFIG_DIRS.get(sys.platform)
+    if config_dir is None:
+        logger.debug(f"Claude Desktop is not supported on {sys.platform}")
         return None
-
-    if path.exists():
+        
+    path = config_dir()
+    if path is None:
+        return None
+        
+    if os.path.isdir(path):
         return path
     
     logger.debug(f"Claude config directory not found at {path}")
@@ -151,6 +232,60 @@ def has_claude_app() -> bool:
     """
     return get_claude_config_path() is not None
 
+def _check_registrations(servers: Dict[str, Any]) -> None:
+    """Log a warning for each invalid server registration.
+    
+    Args:
+        servers: Registrations to check, keyed by server name
+        
+    When fastjsonschema is installed, the registrations are checked by the
+    generated validator in one call and only the working directories,
+    which a schema cannot check, are looked at per entry. The slower
+    per-registration validation runs only if that fails, to report which
+    entries are invalid and why.
+    """
+    if _VALIDATE_SERVERS is not None:
+        try:
+            _VALIDATE_SERVERS(servers)
+        except fastjsonschema.JsonSchemaException:
+            pass
+        else:
+            for name, data in servers.items():
+                if not os.path.exists(data["working_dir"]):
+                    logger.warning(
+                        f"Invalid server registration '{name}': "
+                        f"['Working directory does not exist: {data['working_dir']}']"
+                    )
+            return
+
+    for name, data in servers.items():
+        try:
+            registration = ServerRegistration.from_dict(data)
+            if errors := registration.validate():
+                logger.warning(
+                    f"Invalid server registration '{name}': {errors}"
+                )
+        except ValidationError as e:
+            logger.warning(f"Invalid server data for '{name}': {e}")
+
+def _copy_config(config_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy config data deeply enough for callers to edit registrations.
+    
+    Args:
+        config_data: Claude config data
+        
+    Returns:
+        Copy with its own mcpServers map and registration dicts
+    """
+    copied = dict(config_data)
+    servers = copied.get("mcpServers")
+    if isinstance(servers, dict):
+        copied["mcpServers"] = {
+            name: dict(data) if isinstance(data, dict) else data
+            for name, data in servers.items()
+        }
+    return copied
+
 def load_claude_config(config_path: Path) -> Dict[str, Any]:
     """Load and parse the Claude config file.
     
@@ -162,34 +297,39 @@ def load_claude_config(config_path: Path) -> Dict[str, Any]:
         
     Raises:
         ConfigError: If config file cannot be read or parsed
+        
+    While the file's modification time and size are unchanged, a copy of
+    the previously parsed config is returned without reading it again.
     """
     try:
-        if not config_path.exists():
+        try:
+            st = config_path.stat()
+        except FileNotFoundError:
+            _config_cache.pop(config_path, None)
             return {"mcpServers": {}}
             
-        with config_path.open('r', encoding='utf-8') as f:
-            config_data = json.load(f)
+        cached = _config_cache.get(config_path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return _copy_config(cached[2])
+            
+        # Both parsers accept the raw bytes, so no text decoding pass
+        raw = config_path.read_bytes()
+        config_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         
         # Ensure mcpServers section exists
         if "mcpServers" not in config_data:
             config_data["mcpServers"] = {}
-            
-        # Validate server registrations
-        for name, data in config_data["mcpServers"].items():
-            try:
-                registration = ServerRegistration.from_dict(data)
-                if errors := registration.validate():
-                    logger.warning(
-                        f"Invalid server registration '{name}': {errors}"
-                    )
-            except ValidationError as e:
-                logger.warning(f"Invalid server data for '{name}': {e}")
-            
+        
+        _config_cache[config_path] = (
+            st.st_mtime_ns, st.st_size, _copy_config(config_data)
+        )
         return config_data
         
     except json.JSONDecodeError as e:
+        _config_cache.pop(config_path, None)
         raise ConfigError(f"Failed to parse Claude config: {e}")
     except Exception as e:
+        _config_cache.pop(config_path, None)
         raise ConfigError(f"Error reading Claude config: {e}")
 
 def save_claude_config(config_path: Path, config_data: Dict[str, Any]) -> None:
@@ -203,18 +343,25 @@ def save_claude_config(config_path: Path, config_data: Dict[str, Any]) -> None:
         ConfigError: If config cannot be saved
     """
     try:
-        # Convert any Path objects to strings
-        if "mcpServers" in config_data:
-            for server in config_data["mcpServers"].values():
-                if isinstance(server.get("working_dir"), Path):
-                    server["working_dir"] = str(server["working_dir"])
-        
-        # Write atomically
-        with atomic_replace(config_path) as temp_path:
-            with temp_path.open('w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2)
+        # Path values such as working_dir are written as strings
+        if orjson is not None:
+            content = orjson.dumps(
+                config_data, default=str, option=orjson.OPT_INDENT_2
+            )
+        else:
+            content = json.dumps(config_data, indent=2, default=str).encode('utf-8')
+        
+        # Write atomically; Claude Desktop's config has no other copy
+        atomic_write(config_path, content, fsync=True)
+                
+        # Cache what was written; from_dict accepts Paths left in the copy
+        st = config_path.stat()
+        _config_cache[config_path] = (
+            st.st_mtime_ns, st.st_size, _copy_config(config_data)
+        )
                 
     except (FileError, OSError) as e:
+        _config_cache.pop(config_path, None)
         raise ConfigError(f"Failed to save Claude config: {e}")
 
 def get_server_config(
@@ -229,9 +376,13 @@ def get_server_config(
         
     Returns:
         ServerRegistration if found and valid, None otherwise
+        
+    Registrations are validated here, when one is read, rather than all
+    of them whenever the config is loaded.
     """
     try:
         if server_data := config_data.get("mcpServers", {}).get(server_name):
+            _check_registrations({server_name: server_data})
             return ServerRegistration.from_dict(server_data)
     except ValidationError as e:
         logger.warning(f"Invalid server data for '{server_name}': {e}")
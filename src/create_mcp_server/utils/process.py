@@ -11,19 +11,29 @@ the UV package manager. It provides functions for:
 File: create_mcp_server/utils/process.py
 """
 
+import functools
 import logging
 import os
 import re
+import select
+import shlex
+import shutil
 import signal
 import subprocess
 import sys
+import sysconfig
 import time
 from contextlib import contextmanager
+from importlib import metadata
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Union
+from typing import (
+    TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+)
 
-import click
-from packaging.version import Version, parse
+# click and packaging are imported where first used, so commands that never
+# check or report on UV don't pay for them at startup
+if TYPE_CHECKING:
+    from packaging.version import Version
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +42,14 @@ MIN_UV_VERSION = "0.1.10"
 PROCESS_TIMEOUT = 300  # 5 minutes default timeout
 STARTUP_TIMEOUT = 30   # 30 seconds for startup checks
 SHUTDOWN_TIMEOUT = 5   # 5 seconds for graceful shutdown
+PIPE_BUFFER_SIZE = 65536  # Read buffer for background process output
+
+# Matches the version in ``uv --version`` output such as ``uv 0.4.18``
+UV_VERSION_REGEX = re.compile(r"uv (\d+\.\d+\.\d+)")
+
+# UV subcommands whose trailing package arguments can be combined into a
+# single invocation
+MERGEABLE_UV_COMMANDS = (("pip", "install"), ("pip", "uninstall"), ("add",), ("remove",))
 
 class ProcessError(Exception):
     """Base exception for process-related errors."""
@@ -66,34 +84,162 @@ class CommandError(ProcessError):
         self.returncode = returncode
         self.stdout = stdout
         self.stderr = stderr
-        msg = f"Command '{' '.join(cmd)}' failed with exit code {returncode}"
-        if stdout:
-            msg += f"\nOutput: {stdout}"
-        if stderr:
-            msg += f"\nError: {stderr}"
-        super().__init__(msg)
+        # Keep the raw details as args (so the error still pickles) and
+        # build the message only when it is asked for; callers that catch
+        # and retry never format it
+        super().__init__(cmd, returncode, stdout, stderr)
+
+    def __str__(self) -> str:
+        msg = (
+            f"Command {shlex.join(self.cmd)!r} failed with exit code "
+            f"{self.returncode}"
+        )
+        if self.stdout:
+            msg += f"\nOutput: {self.stdout}"
+        if self.stderr:
+            msg += f"\nError: {self.stderr}"
+        return msg
 
 class TimeoutError(ProcessError):
     """Raised when a process times out."""
     pass
 
 @contextmanager
-def process_cleanup() -> Iterator[None]:
-    """Context manager for cleaning up child processes.
+def process_cleanup(pgids: Optional[List[int]] = None) -> Iterator[List[int]]:
+    """Context manager for cleaning up child process groups.
+    
+    Yields a list to which the caller appends the process group ID of
+    each child it starts in a new session. On exit every listed group is
+    sent SIGTERM, stopping anything the child left running; the caller's
+    own process group is never signalled.
     
-    Ensures child processes are terminated on exit.
+    Args:
+        pgids: Optional list of process group IDs to start from
     """
+    if pgids is None:
+        pgids = []
     try:
-        yield
+        yield pgids
     finally:
-        # Clean up any remaining child processes
-        if sys.platform != "win32":
+        for pgid in pgids:
             try:
-                os.killpg(os.getpgid(0), signal.SIGTERM)
+                os.killpg(pgid, signal.SIGTERM)
             except ProcessLookupError:
                 pass
 
-def check_uv_version(required_version: str = MIN_UV_VERSION) -> Optional[Version]:
+# Location of the uv executable once found; a miss is not remembered, so
+# UV installed later is still picked up
+_uv_path: Optional[str] = None
+
+def _find_uv() -> Optional[str]:
+    """Locate the UV executable on PATH.
+    
+    Returns:
+        Absolute path to uv, or None if it is not installed
+    """
+    global _uv_path
+    if _uv_path is None:
+        _uv_path = shutil.which("uv")
+    return _uv_path
+
+def clear_uv_cache() -> None:
+    """Forget the cached UV location and version, e.g. after reinstalling UV."""
+    global _uv_path
+    _uv_path = None
+    check_uv_version.cache_clear()
+
+def _packaged_uv_version(uv_path: str) -> Optional[str]:
+    """Read the UV version from package metadata instead of running uv.
+    
+    Args:
+        uv_path: Resolved path of the uv executable
+        
+    Returns:
+        Version string if uv_path is the executable installed by the uv
+        wheel in this environment, None otherwise
+    """
+    scripts_dir = sysconfig.get_path("scripts")
+    if os.path.dirname(uv_path) != scripts_dir:
+        # A standalone binary, or a wheel from another environment
+        return None
+    try:
+        return metadata.version("uv")
+    except metadata.PackageNotFoundError:
+        return None
+
+def _probe_uv_version(uv_path: str, timeout: float = 10) -> str:
+    """Run ``uv --version`` and return its output.
+    
+    On POSIX the probe is started with os.posix_spawn and read straight
+    from a pipe, without subprocess's setup or communicate() machinery.
+    glibc's posix_spawn suspends the parent vfork-style until the exec,
+    so the cost doesn't grow with the size of this process.
+    
+    Args:
+        uv_path: Resolved path of the uv executable
+        timeout: Seconds to wait for the output
+        
+    Returns:
+        Output of ``uv --version``
+        
+    Raises:
+        FileNotFoundError: If uv_path doesn't exist
+        subprocess.TimeoutExpired: If uv doesn't finish in time
+        subprocess.CalledProcessError: If uv exits with an error
+    """
+    argv = [uv_path, "--version"]
+    if not hasattr(os, "posix_spawn"):
+        return subprocess.run(
+            argv,
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=timeout
+        ).stdout
+
+    read_fd, write_fd = os.pipe()
+    try:
+        pid = os.posix_spawn(
+            uv_path,
+            argv,
+            os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, write_fd, 1),
+                (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+            ]
+        )
+    except BaseException:
+        os.close(read_fd)
+        raise
+    finally:
+        os.close(write_fd)
+
+    chunks = []
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([read_fd], [], [], remaining)[0]:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                raise subprocess.TimeoutExpired(argv, timeout)
+            chunk = os.read(read_fd, 4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(read_fd)
+
+    _, status = os.waitpid(pid, 0)
+    returncode = os.waitstatus_to_exitcode(status)
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, argv)
+    return b"".join(chunks).decode()
+
+@functools.lru_cache(maxsize=None)
+def check_uv_version(
+    required_version: str = MIN_UV_VERSION
+) -> Optional["Version"]:
     """Check if UV is installed and verify its version.
     
     Args:
@@ -106,42 +252,50 @@ def check_uv_version(required_version: str = MIN_UV_VERSION) -> Optional[Version
         UVNotFoundError: If UV is not installed
         UVVersionError: If UV version is incompatible
         ProcessError: If version check fails
+        
+    A successful check is cached for the life of the process; failures
+    are not, so UV can be installed and checked again.
     """
-    try:
-        result = subprocess.run(
-            ["uv", "--version"],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=10
+    uv_path = _find_uv()
+    if uv_path is None:
+        raise UVNotFoundError(
+            "UV package manager not found. "
+            "To install, visit: https://github.com/astral-sh/uv"
         )
-        version_str = result.stdout.strip()
-        match = re.match(r"uv (\d+\.\d+\.\d+)", version_str)
-        if not match:
-            raise UVVersionError(
-                f"Unable to parse UV version from: {version_str}"
+        
+    version_str = _packaged_uv_version(uv_path)
+    if version_str is None:
+        try:
+            output = _probe_uv_version(uv_path).strip()
+        except FileNotFoundError:
+            raise UVNotFoundError(
+                "UV package manager not found. "
+                "To install, visit: https://github.com/astral-sh/uv"
             )
+        except subprocess.TimeoutExpired:
+            raise ProcessError("Timeout checking UV version")
+        except subprocess.CalledProcessError as e:
+            raise ProcessError(f"Error checking UV version: {e}")
 
-        version = parse(match.group(1))
-        required = parse(required_version)
-
-        if version < required:
+        match = UV_VERSION_REGEX.match(output)
+        if not match:
             raise UVVersionError(
-                f"UV version {version} is older than required version "
-                f"{required_version}"
+                f"Unable to parse UV version from: {output}"
             )
+        version_str = match.group(1)
 
-        return version
+    from packaging.version import parse
 
-    except FileNotFoundError:
-        raise UVNotFoundError(
-            "UV package manager not found. "
-            "To install, visit: https://github.com/astral-sh/uv"
+    version = parse(version_str)
+    required = parse(required_version)
+
+    if version < required:
+        raise UVVersionError(
+            f"UV version {version} is older than required version "
+            f"{required_version}"
         )
-    except subprocess.TimeoutExpired:
-        raise ProcessError("Timeout checking UV version")
-    except subprocess.CalledProcessError as e:
-        raise ProcessError(f"Error checking UV version: {e}")
+
+    return version
 
 def ensure_uv_installed() -> None:
     """Ensure UV is installed at minimum version.
@@ -149,6 +303,8 @@ def ensure_uv_installed() -> None:
     Raises:
         SystemExit: If UV is not installed or version is incompatible
     """
+    import click
+
     try:
         check_uv_version()
     except UVNotFoundError as e:
@@ -190,27 +346,53 @@ def run_uv_command(
         CommandError: If command fails and check is True
         TimeoutError: If command times out
     """
-    cmd = ["uv", *args]
+    # Spawn the resolved path so each run skips the PATH search
+    cmd = [_find_uv() or "uv", *args]
     
-    # Set up process group for cleanup
+    # Set up process group for cleanup. Spawning stays cheap for a large
+    # parent: with no preexec_fn, CPython starts the child with vfork() on
+    # Linux, and setsid()/chdir() run in the child without copying the
+    # parent's page tables. Do not add a preexec_fn here.
     start_new_session = sys.platform != "win32"
     
-    # Prepare environment
-    full_env = os.environ.copy()
-    if env:
-        full_env.update(env)
+    # Without overrides the child inherits our environment as is, so
+    # there is nothing to copy
+    full_env = {**os.environ, **env} if env else None
 
     try:
-        with process_cleanup():
-            result = subprocess.run(
+        with process_cleanup() as pgids:
+            pipe = subprocess.PIPE if capture_output else None
+            with subprocess.Popen(
                 cmd,
                 cwd=str(cwd),
                 env=full_env,
-                capture_output=capture_output,
+                stdout=pipe,
+                stderr=pipe,
                 text=capture_output,
-                check=False,
-                timeout=timeout,
                 start_new_session=start_new_session
+            ) as process:
+                # A new session makes the child its own group leader, so
+                # its pid is the group to clean up
+                if start_new_session:
+                    pgids.append(process.pid)
+                try:
+                    stdout, stderr = process.communicate(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    # Kill the whole group: a grandchild still holding
+                    # the pipes would otherwise stall the final read
+                    if start_new_session:
+                        try:
+                            os.killpg(process.pid, signal.SIGKILL)
+                        except ProcessLookupError:
+                            # The group is gone, e.g. the child left it;
+                            # kill() is a no-op if it already exited
+                            process.kill()
+                    else:
+                        process.kill()
+                    process.communicate()
+                    raise
+            result = subprocess.CompletedProcess(
+                cmd, process.returncode, stdout, stderr
             )
 
         if check and result.returncode != 0:
@@ -228,6 +410,69 @@ def run_uv_command(
             f"Command timed out after {timeout} seconds: {' '.join(cmd)}"
         ) from e
 
+def _merge_prefix(args: List[str]) -> Optional[Tuple[str, ...]]:
+    """Find the mergeable subcommand a UV command starts with.
+    
+    Args:
+        args: Command arguments
+        
+    Returns:
+        The matching MERGEABLE_UV_COMMANDS entry, or None if the command
+        has options or must otherwise run on its own
+    """
+    for prefix in MERGEABLE_UV_COMMANDS:
+        rest = args[len(prefix):]
+        if (
+            tuple(args[:len(prefix)]) == prefix and
+            rest and
+            not any(arg.startswith("-") for arg in rest)
+        ):
+            return prefix
+    return None
+
+def run_uv_commands_batched(
+    commands: Iterable[List[str]],
+    cwd: Union[str, Path],
+    env: Optional[Dict[str, str]] = None,
+    timeout: int = PROCESS_TIMEOUT,
+    check: bool = True
+) -> List[subprocess.CompletedProcess]:
+    """Run several UV commands using as few uv processes as possible.
+    
+    Args:
+        commands: Argument lists, one per UV command, in order
+        cwd: Working directory
+        env: Optional environment variables
+        timeout: Timeout in seconds for each uv invocation
+        check: Whether to check return codes
+        
+    Returns:
+        CompletedProcess for each uv invocation made
+        
+    Raises:
+        CommandError: If a command fails and check is True
+        TimeoutError: If a command times out
+        
+    Consecutive commands with the same mergeable subcommand and no
+    options are combined, so ``pip install a`` followed by
+    ``pip install b`` runs as ``pip install a b``. Every other command
+    still runs as its own invocation, in order.
+    """
+    merged: List[List[str]] = []
+    last_prefix: Optional[Tuple[str, ...]] = None
+    for args in commands:
+        prefix = _merge_prefix(args)
+        if prefix is not None and prefix == last_prefix:
+            merged[-1].extend(args[len(prefix):])
+        else:
+            merged.append(list(args))
+        last_prefix = prefix
+        
+    return [
+        run_uv_command(args, cwd=cwd, env=env, timeout=timeout, check=check)
+        for args in merged
+    ]
+
 def run_background_process(
     args: List[str],
     cwd: Union[str, Path],
@@ -249,10 +494,9 @@ def run_background_process(
     # Set up process group for cleanup
     start_new_session = sys.platform != "win32"
     
-    # Prepare environment
-    full_env = os.environ.copy()
-    if env:
-        full_env.update(env)
+    # Without overrides the child inherits our environment as is, so
+    # there is nothing to copy
+    full_env = {**os.environ, **env} if env else None
 
     try:
         process = subprocess.Popen(
@@ -262,11 +506,12 @@ def run_background_process(
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
+            bufsize=PIPE_BUFFER_SIZE,
             start_new_session=start_new_session
         )
 
-        # Quick check if process failed to start
-        time.sleep(0.1)  # Short delay to check startup
+        # Popen already raises if the exec fails; a child that has exited
+        # by now is reported too, but don't sleep to wait for one
         if process.poll() is not None:
             stdout, stderr = process.communicate()
             raise CommandError(
@@ -295,6 +540,11 @@ def kill_process(
         # Try graceful termination first
         try:
             process.terminate()
+            # Unread output is discarded; closing the pipes also keeps a
+            # child blocked on a full pipe from outliving the timeout
+            for pipe in (process.stdout, process.stderr):
+                if pipe is not None:
+                    pipe.close()
             try:
                 process.wait(timeout=timeout)
             except subprocess.TimeoutExpired:
@@ -323,14 +573,16 @@ def wait_for_process(
     Raises:
         CommandError: If process fails and check is True
         TimeoutError: If timeout is reached
+        
+    Piped output is drained while waiting, so a process that writes more
+    than the pipe can hold does not block forever.
     """
     try:
-        returncode = process.wait(timeout=timeout)
-        if check and returncode != 0:
-            stdout, stderr = process.communicate()
+        stdout, stderr = process.communicate(timeout=timeout)
+        if check and process.returncode != 0:
             raise CommandError(
                 cmd=process.args,
-                returncode=returncode,
+                returncode=process.returncode,
                 stdout=stdout,
                 stderr=stderr
             )
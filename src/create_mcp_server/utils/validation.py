@@ -12,35 +12,80 @@ when creating an MCP server, such as:
 File: create-mcp-server/utils/validation.py
 """
 
+import functools
 import logging
 import os
 import re
+import stat
 import string
 from pathlib import Path
-from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+from types import MappingProxyType
+from typing import Any, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
 
-from packaging.version import InvalidVersion, Version, parse
+# google-re2 matches in linear time whatever the input; the URL check uses
+# it when installed
+try:
+    import re2
+except ImportError:
+    re2 = None
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for results without details, so callers can
+# always treat details as a mapping
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
 class ValidationResult(NamedTuple):
     """Result of a validation check."""
     is_valid: bool
     message: str
-    details: Optional[Dict] = None
-
-# Regular expressions for validation
-PACKAGE_NAME_REGEX = re.compile(r'^[a-zA-Z0-9][-a-zA-Z0-9_.]*[a-zA-Z0-9]$')
-URL_REGEX = re.compile(
-    r'^https?://'  # http:// or https://
-    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
-    r'localhost|'  # localhost
-    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ip
-    r'(?::\d+)?'  # optional port
-    r'(?:/?|[/?]\S+)$', re.IGNORECASE
+    details: Mapping[str, Any] = _EMPTY_DETAILS
+
+# Results are immutable, so every passing check returns this one instance
+_VALID = ValidationResult(True, "")
+
+# Regular expressions for validation. Those applied with fullmatch() carry
+# no anchors; re.ASCII keeps the classes and case folding to ASCII
+PACKAGE_NAME_REGEX = re.compile(r'[a-zA-Z0-9][-a-zA-Z0-9_.]*[a-zA-Z0-9]', re.ASCII)
+PACKAGE_CHARS_REGEX = re.compile(r'[-a-zA-Z0-9_.]+', re.ASCII)
+# Exactly the names check_package_name accepts, as one pattern for
+# validators that cannot run its individual checks (JSON Schema)
+VALID_PACKAGE_NAME_PATTERN = r'[a-zA-Z][-a-zA-Z0-9_]{0,98}[a-zA-Z0-9]'
+# Spelled out in ASCII classes with no flags: RE2 folds case and reads \s
+# differently from re, and the pattern must mean the same to both and to
+# the JSON Schema validator
+URL_PATTERN = (
+    r'[Hh][Tt][Tt][Pp][Ss]?://'  # http:// or https://
+    r'(?:(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,6}\.?|'  # domain
+    r'[Ll][Oo][Cc][Aa][Ll][Hh][Oo][Ss][Tt]|'  # localhost
+    r'[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3})'  # ip
+    r'(?::[0-9]+)?'  # optional port
+    r'(?:/?|[/?][^\t\n\v\f\r ]+)'
+)
+URL_REGEX = (
+    re2.compile(URL_PATTERN) if re2 is not None else re.compile(URL_PATTERN)
+)
+# Dots only separate the domain labels, so the pattern can't backtrack
+# over the same characters more than one way
+EMAIL_REGEX = re.compile(
+    r'[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}',
+    re.ASCII
 )
-EMAIL_REGEX = re.compile(r'([A-Za-z0-9]+[.-_])*[A-Za-z0-9]+@[A-Za-z0-9-]+(\.[A-Z|a-z]{2,})+')
+CONTROL_CHARS_REGEX = re.compile(r'[\x00-\x1f]', re.ASCII)
+# Plain release versions such as 1.0.0, valid without a full PEP 440 parse
+SIMPLE_VERSION_REGEX = re.compile(r'\d+(?:\.\d+){0,3}', re.ASCII)
+
+# Device names Windows reserves, compared case-insensitively
+RESERVED_NAMES = frozenset({
+    'con', 'prn', 'aux', 'nul', 'com1', 'com2', 'com3', 'com4',
+    'lpt1', 'lpt2', 'lpt3'
+})
+
+# Deletes printable characters, so what is left of a string is its
+# non-printable characters
+NON_PRINTABLE_TABLE = str.maketrans("", "", string.printable)
 
+@functools.lru_cache(maxsize=256)
 def check_package_name(name: str) -> ValidationResult:
     """Validate a Python package name against standard naming conventions.
 
@@ -58,6 +103,9 @@ def check_package_name(name: str) -> ValidationResult:
         - Must be a valid Python identifier
         - Must be lowercase (recommendation only - warns but doesn't fail)
         - Must be between 2 and 100 characters
+
+    Results are cached by name, so the lowercase warning is logged once
+    per name.
     """
     if not name:
         return ValidationResult(False, "Package name cannot be empty")
@@ -68,47 +116,94 @@ def check_package_name(name: str) -> ValidationResult:
     if len(name) > 100:
         return ValidationResult(False, "Package name must be under 100 characters")
 
-    if " " in name:
-        return ValidationResult(False, "Package name must not contain spaces")
+    # One scan covers the character set and the first/last characters;
+    # the individual checks only run to explain a failure
+    if not PACKAGE_NAME_REGEX.fullmatch(name):
+        if " " in name:
+            return ValidationResult(False, "Package name must not contain spaces")
 
-    if not name.isascii():
-        return ValidationResult(False, "Package name must contain only ASCII characters")
+        if not name.isascii():
+            return ValidationResult(False, "Package name must contain only ASCII characters")
 
-    allowed_chars = set(string.ascii_letters + string.digits + "-_.")
-    if not all(c in allowed_chars for c in name):
-        return ValidationResult(
-            False,
-            "Package name must contain only letters, digits, underscore, "
-            "hyphen, and period"
-        )
+        if not PACKAGE_CHARS_REGEX.fullmatch(name):
+            return ValidationResult(
+                False,
+                "Package name must contain only letters, digits, underscore, "
+                "hyphen, and period"
+            )
 
-    if name.startswith(("_", "-", ".")) or name.endswith(("_", "-", ".")):
         return ValidationResult(
             False,
             "Package name must not start or end with underscore, hyphen, or period"
         )
 
-    # Convert to Python package name format for additional checks
-    package_name = name.replace("-", "_")
-    if not package_name.isidentifier():
+    # The name must also be an identifier once hyphens become underscores.
+    # Given the regex above, that only rules out periods and a leading digit
+    if "." in name or name[0].isdigit():
         return ValidationResult(
             False,
             "Package name must be a valid Python identifier when hyphens "
             "are converted to underscores"
         )
 
-    # Check against regex pattern
-    if not PACKAGE_NAME_REGEX.match(name):
-        return ValidationResult(
-            False,
-            "Package name contains invalid characters or format"
-        )
-
     # Warning for non-lowercase (but still valid)
     if not name.islower():
         logger.warning("Package name should be lowercase (but will be accepted)")
 
-    return ValidationResult(True, "")
+    return _VALID
+
+def check_package_names(names: Iterable[str]) -> List[ValidationResult]:
+    """Validate many package names at once.
+
+    Args:
+        names: The package names to validate
+
+    Returns:
+        One ValidationResult per name, in order, as check_package_name
+        would return it
+    """
+    # Valid lowercase names, the usual case, pass with one regex call;
+    # anything else goes through check_package_name for its message and
+    # warning
+    fullmatch = PACKAGE_NAME_REGEX.fullmatch
+    results = []
+    append = results.append
+    for name in names:
+        if (
+            2 <= len(name) <= 100 and
+            fullmatch(name) and
+            "." not in name and
+            not name[0].isdigit() and
+            name.islower()
+        ):
+            append(_VALID)
+        else:
+            append(check_package_name(name))
+    return results
+
+@functools.lru_cache(maxsize=256)
+def _normalize_version(version: str) -> Optional[str]:
+    """Normalize a version string the way packaging does.
+
+    Args:
+        version: The version string to normalize
+
+    Returns:
+        The normalized version, or None if it is not valid under PEP 440
+
+    Only the string is cached, so each caller still gets its own details.
+    """
+    if SIMPLE_VERSION_REGEX.fullmatch(version):
+        # Normalized the way packaging would, e.g. 01.0 -> 1.0
+        return ".".join(str(int(part)) for part in version.split("."))
+
+    # Imported here so loading the validators doesn't import packaging
+    from packaging.version import InvalidVersion, parse
+
+    try:
+        return str(parse(version))
+    except InvalidVersion:
+        return None
 
 def check_version(version: str) -> ValidationResult:
     """Validate a version string against PEP 440.
@@ -126,18 +221,13 @@ def check_version(version: str) -> ValidationResult:
         - 1.0.0rc1
         - 1.0.0.post1
     """
-    try:
-        parsed = parse(version)
-        return ValidationResult(
-            True, 
-            "",
-            {'parsed_version': str(parsed)}
-        )
-    except InvalidVersion:
+    parsed = _normalize_version(version)
+    if parsed is None:
         return ValidationResult(
             False,
             f"Version '{version}' is not a valid semantic version (e.g. 1.0.0)"
         )
+    return ValidationResult(True, "", {'parsed_version': parsed})
 
 def check_project_path(path: Path) -> ValidationResult:
     """Validate a project path.
@@ -157,29 +247,38 @@ def check_project_path(path: Path) -> ValidationResult:
         - Path must not contain invalid characters
     """
     try:
-        resolved_path = path.resolve()
+        # Lexical normalization; resolve() would stat every component
+        resolved_path = Path(os.path.abspath(path))
         parent = resolved_path.parent
 
         # Check path depth
         if len(resolved_path.parts) > 50:
             return ValidationResult(False, "Path is too deep")
 
-        # Check parent directory
-        if not parent.exists():
+        # One stat of the parent, and one scandir of the path that both
+        # tells whether it exists and whether it is empty
+        try:
+            parent_mode = os.stat(parent).st_mode
+        except (FileNotFoundError, NotADirectoryError):
             return ValidationResult(False, f"Parent directory does not exist: {parent}")
+        if not stat.S_ISDIR(parent_mode):
+            return ValidationResult(False, f"Parent path is not a directory: {parent}")
 
         # Check if path exists
-        if resolved_path.exists():
-            if not resolved_path.is_dir():
-                return ValidationResult(
-                    False,
-                    f"Path exists and is not a directory: {resolved_path}"
-                )
-            if any(resolved_path.iterdir()):
-                return ValidationResult(
-                    False,
-                    f"Directory is not empty: {resolved_path}"
-                )
+        try:
+            with os.scandir(resolved_path) as entries:
+                if next(entries, None) is not None:
+                    return ValidationResult(
+                        False,
+                        f"Directory is not empty: {resolved_path}"
+                    )
+        except FileNotFoundError:
+            pass
+        except NotADirectoryError:
+            return ValidationResult(
+                False,
+                f"Path exists and is not a directory: {resolved_path}"
+            )
 
         # Check write permissions
         if not os.access(parent, os.W_OK):
@@ -189,12 +288,10 @@ def check_project_path(path: Path) -> ValidationResult:
             )
 
         # Check for reserved names
-        reserved_names = {'con', 'prn', 'aux', 'nul', 'com1', 'com2', 'com3',
-                         'com4', 'lpt1', 'lpt2', 'lpt3'}
-        if path.name.lower() in reserved_names:
+        if path.name.lower() in RESERVED_NAMES:
             return ValidationResult(False, f"'{path.name}' is a reserved name")
 
-        return ValidationResult(True, "")
+        return _VALID
 
     except PermissionError as e:
         return ValidationResult(False, f"Permission error: {e}")
@@ -230,16 +327,15 @@ def validate_description(description: str) -> ValidationResult:
         )
 
     # Check for control characters
-    if any(ord(c) < 32 for c in description):
+    if CONTROL_CHARS_REGEX.search(description):
         return ValidationResult(
             False,
             "Description must not contain control characters"
         )
 
     # Check for mostly printable characters (allow some whitespace)
-    printable = set(string.printable)
-    non_printable = [c for c in description if c not in printable]
-    if len(non_printable) > len(description) * 0.1:  # Allow 10% non-printable
+    non_printable = len(description.translate(NON_PRINTABLE_TABLE))
+    if non_printable > len(description) * 0.1:  # Allow 10% non-printable
         return ValidationResult(
             False,
             "Description contains too many non-printable characters"
@@ -253,8 +349,9 @@ def validate_description(description: str) -> ValidationResult:
             "Description should contain at least 3 words"
         )
 
-    return ValidationResult(True, "")
+    return _VALID
 
+@functools.lru_cache(maxsize=256)
 def validate_url(url: str) -> ValidationResult:
     """Validate a URL string.
 
@@ -270,10 +367,13 @@ def validate_url(url: str) -> ValidationResult:
     if len(url) > 2000:
         return ValidationResult(False, "URL is too long")
 
-    if not URL_REGEX.match(url):
+    # Anything without an http(s) scheme fails without running the regex;
+    # like the regex, the scheme is case-insensitive
+    scheme_ok = url[:8].lower().startswith(("http://", "https://"))
+    if not scheme_ok or not URL_REGEX.fullmatch(url):
         return ValidationResult(False, "Invalid URL format")
 
-    return ValidationResult(True, "")
+    return _VALID
 
 def validate_email(email: str) -> ValidationResult:
     """Validate an email address.
@@ -290,10 +390,10 @@ def validate_email(email: str) -> ValidationResult:
     if len(email) > 254:  # RFC 5321
         return ValidationResult(False, "Email is too long")
 
-    if not EMAIL_REGEX.match(email):
+    if not EMAIL_REGEX.fullmatch(email):
         return ValidationResult(False, "Invalid email format")
 
-    return ValidationResult(True, "")
+    return _VALID
 
 def validate_resource_limits(
     memory_mb: int,
@@ -310,6 +410,15 @@ def validate_resource_limits(
     Returns:
         ValidationResult with validation status and message
     """
+    # Valid limits, the usual case, pass with one compound check; the
+    # individual checks below only pick the error message
+    if (
+        50 <= memory_mb <= 4096 and
+        0 <= cpu_percent <= 100 and
+        1 <= timeout_seconds <= 3600
+    ):
+        return _VALID
+
     if memory_mb < 50 or memory_mb > 4096:
         return ValidationResult(False, "Memory limit must be between 50MB and 4GB")
 
@@ -319,4 +428,4 @@ def validate_resource_limits(
     if timeout_seconds < 1 or timeout_seconds > 3600:
         return ValidationResult(False, "Timeout must be between 1 and 3600 seconds")
 
-    return ValidationResult(True, "")
\ No newline at end of file
+    return _VALID
\ No newline at end of file